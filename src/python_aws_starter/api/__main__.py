@@ -0,0 +1,28 @@
+"""Serve the timeline API: ``python -m python_aws_starter.api``.
+
+Reads ``HOST``/``PORT`` (default 127.0.0.1:8000) and ``WORKERS`` (see
+``ApplicationConfig``). With ``uvicorn[standard]`` installed the server runs on
+uvloop with the httptools parser.
+"""
+
+import os
+
+import uvicorn
+
+from python_aws_starter.config import config
+
+
+def main() -> None:
+    uvicorn.run(
+        "python_aws_starter.api.app:app",
+        host=os.getenv("HOST", "127.0.0.1"),
+        port=int(os.getenv("PORT", "8000")),
+        # "auto" picks uvloop/httptools when installed, asyncio/h11 otherwise
+        loop="auto",
+        http="auto",
+        workers=config.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,218 +1,227 @@
+import asyncio
 import logging
-from typing import Optional
-from fastapi import FastAPI, HTTPException, Query
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, TypeAdapter
 
-from python_aws_starter.repositories.in_memory import InMemoryRepository
-from python_aws_starter.config import config
+from python_aws_starter.api.middleware import CachingMiddleware
+from python_aws_starter.api.responses import ORJSONResponse
+from python_aws_starter.api.routes import EventSearchFilters, GeoSearchFilters, PeopleSearchFilters
+
+from python_aws_starter.repositories.in_memory import Entity, InMemoryRepository
+from python_aws_starter.config import Environment, config
+from python_aws_starter.models.events import Event
+from python_aws_starter.models.people import Person
+from python_aws_starter.models.geography import Geography
+from python_aws_starter.models.wikidata_meta import Claim, WikibaseEntity
 from python_aws_starter.utils import wikidata as wd
-from tests.fixtures import sample_dataset as sd
+from python_aws_starter.utils import wiki_cache
 
 # Configure root logging early so repository modules use the same configuration.
-numeric_level = getattr(logging, config.log_level.upper(), logging.INFO)
-logging.basicConfig(level=numeric_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+_LOG_LEVEL = getattr(logging, config.log_level.upper(), logging.INFO)
+logging.basicConfig(level=_LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Timeline Pivot API")
 
-# Add CORS middleware to allow frontend access
+def _build_repo() -> InMemoryRepository:
+    """Build the repository: the sample fixtures in development, empty otherwise."""
+    if config.environment is Environment.DEVELOPMENT:
+        # Imported here so staging/production never load the test fixtures
+        from tests.fixtures import sample_dataset as sd
+
+        return InMemoryRepository(events=sd.get_events(), people=sd.get_people(), geographies=sd.get_geographies())
+    return InMemoryRepository(events=[], people=[], geographies=[])
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the repository (fixtures + indexes) off the import path and the event loop
+    app.state.repo = await run_in_threadpool(_build_repo)
+    yield
+    await wd.aclose_async_client()
+
+
+app = FastAPI(title="Timeline Pivot API", default_response_class=ORJSONResponse, lifespan=lifespan)
+
+# ETag/Cache-Control for search and Wikidata entity responses. Registered before
+# CORS so CORS stays outermost and 304s still carry the CORS headers.
+app.add_middleware(CachingMiddleware)
+
+# Add CORS middleware to allow frontend access. The frontend only issues GETs;
+# preflight responses are cached by the browser for a day (max_age).
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:8080", "http://127.0.0.1:8080", "http://localhost:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "OPTIONS"],
+    allow_headers=["Content-Type", "If-None-Match"],
+    expose_headers=["ETag"],
+    max_age=86400,
 )
 
-# Initialize a demo repository from test fixtures (suitable for local demo/dev)
-_repo = InMemoryRepository(events=sd.get_events(), people=sd.get_people(), geographies=sd.get_geographies())
+
+async def get_repo(request: Request) -> InMemoryRepository:
+    """The repository built at startup.
+
+    Async so it resolves on the event loop without a threadpool hop. Built on
+    first use when the app runs without its lifespan (e.g. a TestClient used
+    outside a ``with`` block).
+    """
+    repo = getattr(request.app.state, "repo", None)
+    if repo is None:
+        repo = request.app.state.repo = _build_repo()
+    return repo
+
+
+# Serializers built once at import: a list is dumped in a single pydantic-core
+# call instead of one model_dump() per item plus FastAPI's re-encoding pass.
+# Endpoints return Response objects so FastAPI's jsonable_encoder never runs.
+_results_adapter = TypeAdapter(List[Union[WikibaseEntity, Person, Event, Geography]])
+_claims_adapter = TypeAdapter(List[Claim])
+_claims_by_property_adapter = TypeAdapter(Dict[str, List[Claim]])
+
+
+def _json_list(items: List[Any]) -> Response:
+    """Serialize a list of entity models straight to a JSON response."""
+    return Response(content=_results_adapter.dump_json(items), media_type="application/json")
+
+
+def _json_model(model: BaseModel) -> Response:
+    """Serialize a single model straight to a JSON response."""
+    return Response(content=model.__pydantic_serializer__.to_json(model), media_type="application/json")
 
 
 @app.get("/pivot")
-def pivot(from_dim: str = Query(..., alias="from"), to_dim: str = Query(..., alias="to"), id: str = Query(...)):
+def pivot(
+    from_dim: str = Query(..., alias="from"),
+    to_dim: str = Query(..., alias="to"),
+    id: str = Query(...),
+    repo: InMemoryRepository = Depends(get_repo),
+):
     """Pivot from one dimension to another. Example: /pivot?from=people&to=events&id=person_napoleon"""
-    res = _repo.pivot(from_dim, to_dim, id)
+    res = repo.pivot(from_dim, to_dim, id)
     if res is None:
         raise HTTPException(status_code=404, detail="No results")
-    # serialize pydantic models
-    return [r.model_dump() for r in res]
+    return _json_list(res)
 
 
-@app.get("/search/events")
-def search_events(
-    text: Optional[str] = None,
-    q: Optional[str] = None,  # Accept 'q' parameter from frontend
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    geography_id: Optional[str] = None,
-    center_lat: Optional[float] = None,
-    center_lon: Optional[float] = None,
-    within_km: Optional[float] = None,
-):
-    # Use 'q' if provided, otherwise 'text'
-    search_query = q or text
-    
-    results = []
-    
+async def _search_with_wikidata(search_query: Optional[str], local_search: Callable[..., List[Any]], **local_kwargs: Any) -> Response:
+    """Run the Wikidata search and the local repository search concurrently.
+
+    The local search is synchronous, so it runs in the threadpool while the
+    Wikidata request is awaited; the response time is bounded by the slower of
+    the two rather than their sum. Wikidata failures are logged and skipped.
+    """
+    local_task = asyncio.create_task(run_in_threadpool(local_search, **local_kwargs))
+
     # Search Wikidata if DATA_SOURCE is not "local" and we have a query
     if config.data_source != "local" and search_query:
-        try:
-            # Use native WikibaseEntity structure for Wikidata searches
-            wikidata_results = wd.search_wikidata_entities_as_wikibase(search_query, limit=20)
-            results.extend([r.model_dump() for r in wikidata_results])
-            logger.info(f"Found {len(wikidata_results)} entities from Wikidata for query: {search_query}")
-        except Exception as e:
-            logger.error(f"Error searching Wikidata: {e}")
-    
-    # Also search local repository (returns Event models)
-    center = None
-    if center_lat is not None and center_lon is not None:
-        center = (center_lat, center_lon)
-    local_results = _repo.search_events(
-        text=search_query,
-        start_date=start_date,
-        end_date=end_date,
-        geography_id=geography_id,
-        center_coord=center,
-        within_km=within_km,
+        # Use native WikibaseEntity structure for Wikidata searches
+        wiki_task = asyncio.create_task(wd.search_wikidata_entities_as_wikibase(search_query, limit=20))
+        wikidata_results, local_results = await asyncio.gather(wiki_task, local_task, return_exceptions=True)
+    else:
+        wikidata_results, local_results = [], await local_task
+
+    if isinstance(local_results, BaseException):
+        raise local_results
+
+    results = []
+    if isinstance(wikidata_results, BaseException):
+        logger.error("Error searching Wikidata: %s", wikidata_results)
+    elif wikidata_results:
+        results.extend(wikidata_results)
+        logger.info("Found %d entities from Wikidata for query: %s", len(wikidata_results), search_query)
+
+    results.extend(local_results)
+    return _json_list(results)
+
+
+@app.get("/search/events")
+async def search_events(f: EventSearchFilters = Depends(), repo: InMemoryRepository = Depends(get_repo)):
+    return await _search_with_wikidata(
+        f.search_query,
+        repo.search_events,
+        text=f.search_query,
+        start_date=f.start_date,
+        end_date=f.end_date,
+        geography_id=f.geography_id,
+        center_coord=f.center,
+        within_km=f.within_km,
     )
-    results.extend([r.model_dump() for r in local_results])
-    
-    return results
 
 
 @app.get("/search/people")
-def search_people(
-    text: Optional[str] = None,
-    q: Optional[str] = None,  # Accept 'q' parameter from frontend
-    related_event_id: Optional[str] = None,
-):
-    # Use 'q' if provided, otherwise 'text'
-    search_query = q or text
-    
-    results = []
-    
-    # Search Wikidata if DATA_SOURCE is not "local" and we have a query
-    if config.data_source != "local" and search_query:
-        try:
-            # Use native WikibaseEntity structure for Wikidata searches
-            wikidata_results = wd.search_wikidata_entities_as_wikibase(search_query, limit=20)
-            results.extend([r.model_dump() for r in wikidata_results])
-            logger.info(f"Found {len(wikidata_results)} entities from Wikidata for query: {search_query}")
-        except Exception as e:
-            logger.error(f"Error searching Wikidata: {e}")
-    
-    # Also search local repository (returns Person models)
-    local_results = _repo.search_people(text=search_query, related_event_id=related_event_id)
-    results.extend([r.model_dump() for r in local_results])
-    
-    return results
+async def search_people(f: PeopleSearchFilters = Depends(), repo: InMemoryRepository = Depends(get_repo)):
+    return await _search_with_wikidata(
+        f.search_query, repo.search_people, text=f.search_query, related_event_id=f.related_event_id
+    )
 
 
 @app.get("/search/geographies")
-def search_geographies(
-    text: Optional[str] = None,
-    q: Optional[str] = None,  # Accept 'q' parameter from frontend
-    center_lat: Optional[float] = None,
-    center_lon: Optional[float] = None,
-    within_km: Optional[float] = None,
-):
-    # Use 'q' if provided, otherwise 'text'
-    search_query = q or text
-    
-    results = []
-    
-    # Search Wikidata if DATA_SOURCE is not "local" and we have a query
-    if config.data_source != "local" and search_query:
-        try:
-            # Use native WikibaseEntity structure for Wikidata searches
-            wikidata_results = wd.search_wikidata_entities_as_wikibase(search_query, limit=20)
-            results.extend([r.model_dump() for r in wikidata_results])
-            logger.info(f"Found {len(wikidata_results)} entities from Wikidata for query: {search_query}")
-        except Exception as e:
-            logger.error(f"Error searching Wikidata: {e}")
-    
-    # Also search local repository (returns Geography models)
-    center = None
-    if center_lat is not None and center_lon is not None:
-        center = (center_lat, center_lon)
-    local_results = _repo.search_geographies(text=search_query, center_coord=center, within_km=within_km)
-    results.extend([r.model_dump() for r in local_results])
-    
-    return results
+async def search_geographies(f: GeoSearchFilters = Depends(), repo: InMemoryRepository = Depends(get_repo)):
+    return await _search_with_wikidata(
+        f.search_query, repo.search_geographies, text=f.search_query, center_coord=f.center, within_km=f.within_km
+    )
 
 
 # Claims-based query endpoints
+def entity_dep(entity_id: str, repo: InMemoryRepository = Depends(get_repo)) -> Entity:
+    """Resolve a local entity (person, event or geography) by id, or 404."""
+    entity = repo.get_entity_by_id(entity_id)
+    if not entity:
+        raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found")
+    return entity
+
+
 @app.get("/entity/{entity_id}/claims")
-def get_entity_claims(entity_id: str, property_id: Optional[str] = None):
+def get_entity_claims(entity_id: str, property_id: Optional[str] = None, entity: Entity = Depends(entity_dep)):
     """Get claims for an entity, optionally filtered by property ID.
     
     Example: /entity/person_napoleon/claims?property_id=P569
     """
-    # Try to find entity in local repository
-    entity = None
-    
-    # Check people
-    person = _repo.get_person_by_id(entity_id)
-    if person:
-        entity = person
-    else:
-        # Check events
-        event = _repo.get_event_by_id(entity_id)
-        if event:
-            entity = event
-        else:
-            # Check geographies
-            geo = _repo.get_geo_by_id(entity_id)
-            if geo:
-                entity = geo
-    
-    if not entity:
-        raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found")
-    
     if property_id:
         claims = entity.get_claims(property_id)
-        return {"entity_id": entity_id, "property_id": property_id, "claims": [c.model_dump() for c in claims]}
+        return ORJSONResponse({"entity_id": entity_id, "property_id": property_id, "claims": _claims_adapter.dump_python(claims, mode="json")})
     else:
-        return {"entity_id": entity_id, "claims": {pid: [c.model_dump() for c in claims] for pid, claims in entity.claims.items()}}
+        return ORJSONResponse({"entity_id": entity_id, "claims": _claims_by_property_adapter.dump_python(entity.claims, mode="json")})
 
 
 @app.get("/entity/{entity_id}/claim/{property_id}")
-def get_entity_claim(entity_id: str, property_id: str):
+def get_entity_claim(entity_id: str, property_id: str, entity: Entity = Depends(entity_dep)):
     """Get the best claim for a specific property on an entity.
     
     Example: /entity/person_napoleon/claim/P569
     """
-    # Try to find entity in local repository
-    entity = None
-    
-    # Check people
-    person = _repo.get_person_by_id(entity_id)
-    if person:
-        entity = person
-    else:
-        # Check events
-        event = _repo.get_event_by_id(entity_id)
-        if event:
-            entity = event
-        else:
-            # Check geographies
-            geo = _repo.get_geo_by_id(entity_id)
-            if geo:
-                entity = geo
-    
-    if not entity:
-        raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found")
-    
     claim = entity.get_best_claim(property_id)
     if not claim:
         raise HTTPException(status_code=404, detail=f"No claim found for property {property_id} on entity {entity_id}")
     
-    return {"entity_id": entity_id, "property_id": property_id, "claim": claim.model_dump()}
+    return ORJSONResponse({"entity_id": entity_id, "property_id": property_id, "claim": claim.model_dump(mode="json")})
+
+
+# P31 (instance of) targets used to classify Wikidata entities
+_PERSON_TYPES = frozenset({"Q5"})  # human
+_EVENT_TYPES = frozenset({"Q1656682", "Q1190554", "Q1983062"})  # event, occurrence, historical event
+_GEO_TYPES = frozenset({"Q6256", "Q515", "Q5107", "Q15284", "Q23442"})  # geographic types
+
+
+def _instance_of_qids(instance_claims: List[Any]) -> Set[str]:
+    """Target QIDs of raw Wikidata P31 claims, skipping malformed ones."""
+    qids = set()
+    for inst_claim in instance_claims:
+        try:
+            inst_entity = inst_claim["mainsnak"]["datavalue"]["value"]
+            qids.add(inst_entity["id"])
+        except (KeyError, TypeError):
+            continue
+    return qids
 
 
 @app.get("/wikidata/entity/{qid}")
-def get_wikidata_entity_by_qid(qid: str):
+async def get_wikidata_entity_by_qid(qid: str):
     """Fetch full entity data from Wikidata by QID using REST API.
     
     This endpoint is used for linking - when you have a QID from a search result
@@ -222,13 +231,16 @@ def get_wikidata_entity_by_qid(qid: str):
     Example: /wikidata/entity/Q123
     """
     try:
+        # One canonical form for the cache key and the batched fetch ('q90' -> 'Q90')
+        qid = qid.strip().upper()
+        
         # Extract QID if it's in the format "person_wikidata_Q123"
         if "_" in qid:
             parts = qid.split("_")
             qid = parts[-1] if parts[-1].startswith("Q") else qid
         
-        # Fetch full entity using REST API
-        entity_data = wd.get_wikidata_entity(qid)
+        # Fetch full entity using REST API; concurrent requests are batched
+        entity_data = await wd.get_wikidata_entity_async(qid)
         if not entity_data:
             raise HTTPException(status_code=404, detail=f"Entity {qid} not found in Wikidata")
         
@@ -236,69 +248,44 @@ def get_wikidata_entity_by_qid(qid: str):
         claims = entity_data.get("claims", {})
         instance_claims = claims.get("P31", [])
         
-        # Check if it's a person
-        is_person = False
-        for inst_claim in instance_claims:
-            try:
-                inst_entity = inst_claim.get("mainsnak", {}).get("datavalue", {}).get("value", {})
-                if isinstance(inst_entity, dict) and inst_entity.get("id") == "Q5":  # human
-                    is_person = True
-                    break
-            except (KeyError, TypeError):
-                continue
+        # Classify from the P31 (instance of) targets, collected in one pass
+        inst_qids = _instance_of_qids(instance_claims)
         
-        if is_person:
+        if inst_qids & _PERSON_TYPES:
             person = wd.wikidata_to_person(entity_data, qid)
             if person:
-                return person.model_dump()
-        
-        # Check if it's an event
-        is_event = False
-        for inst_claim in instance_claims:
-            try:
-                inst_entity = inst_claim.get("mainsnak", {}).get("datavalue", {}).get("value", {})
-                if isinstance(inst_entity, dict):
-                    inst_qid = inst_entity.get("id", "")
-                    if inst_qid in ["Q1656682", "Q1190554", "Q1983062"]:  # event, occurrence, historical event
-                        is_event = True
-                        break
-            except (KeyError, TypeError):
-                continue
+                return _json_model(person)
         
-        if is_event:
+        if inst_qids & _EVENT_TYPES:
             event = wd.wikidata_to_event(entity_data, qid)
             if event:
-                return event.model_dump()
-        
-        # Check if it's a geography (has coordinates or geographic type)
-        has_coords = "P625" in claims
-        is_geo = False
-        for inst_claim in instance_claims:
-            try:
-                inst_entity = inst_claim.get("mainsnak", {}).get("datavalue", {}).get("value", {})
-                if isinstance(inst_entity, dict):
-                    inst_qid = inst_entity.get("id", "")
-                    if inst_qid in ["Q6256", "Q515", "Q5107", "Q15284", "Q23442"]:  # geographic types
-                        is_geo = True
-                        break
-            except (KeyError, TypeError):
-                continue
+                return _json_model(event)
         
-        if is_geo or has_coords:
+        # Geography if it has coordinates or a geographic type
+        if "P625" in claims or inst_qids & _GEO_TYPES:
             geography = wd.wikidata_to_geography(entity_data, qid)
             if geography:
-                return geography.model_dump()
+                return _json_model(geography)
         
         # If we can't determine type, return raw entity data
-        return entity_data
+        return ORJSONResponse(entity_data)
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching Wikidata entity {qid}: {e}")
+        logger.error("Error fetching Wikidata entity %s: %s", qid, e)
         raise HTTPException(status_code=500, detail=f"Error fetching entity: {str(e)}")
 
 
+# Unauthenticated and state-changing, so it only exists in development
+if config.environment is Environment.DEVELOPMENT:
+
+    @app.post("/admin/cache/flush")
+    def flush_wikidata_cache():
+        """Drop all cached Wikidata search results and entities (development only)."""
+        return {"flushed": wiki_cache.flush()}
+
+
 @app.get("/random")
 def get_random_entity(instance_of: Optional[str] = Query(None, description="Optional QID to filter by instance of (e.g., Q5 for human)")):
     """Get a random Wikidata entity to populate the frontend on initial load.
@@ -316,11 +303,11 @@ def get_random_entity(instance_of: Optional[str] = Query(None, description="Opti
         entity = wd.get_random_wikidata_entity(instance_of=instance_of)
         if not entity:
             raise HTTPException(status_code=404, detail="No random entity found")
-        return entity.model_dump()
+        return _json_model(entity)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error fetching random entity: {e}")
+        logger.error("Error fetching random entity: %s", e)
         raise HTTPException(status_code=500, detail=f"Error fetching random entity: {str(e)}")
 
 
@@ -329,41 +316,10 @@ def search_by_property(
     property_id: str = Query(..., description="Property ID to search (e.g., P569 for date of birth)"),
     value: Optional[str] = Query(None, description="Value to match (optional)"),
     entity_type: Optional[str] = Query(None, description="Entity type filter: 'person', 'event', or 'geography'"),
+    repo: InMemoryRepository = Depends(get_repo),
 ):
     """Search entities by property value.
     
     Example: /search/by-property?property_id=P569&value=1769-08-15
     """
-    results = []
-    
-    # Search people
-    if not entity_type or entity_type == "person":
-        for person in _repo.list_people():
-            claims = person.get_claims(property_id)
-            if claims:
-                if value:
-                    # TODO: Implement value matching
-                    pass
-                results.append(person)
-    
-    # Search events
-    if not entity_type or entity_type == "event":
-        for event in _repo.list_events():
-            claims = event.get_claims(property_id)
-            if claims:
-                if value:
-                    # TODO: Implement value matching
-                    pass
-                results.append(event)
-    
-    # Search geographies
-    if not entity_type or entity_type == "geography":
-        for geo in _repo.list_geographies():
-            claims = geo.get_claims(property_id)
-            if claims:
-                if value:
-                    # TODO: Implement value matching
-                    pass
-                results.append(geo)
-    
-    return [r.model_dump() for r in results]
+    return _json_list(repo.search_by_property(property_id, value=value, entity_type=entity_type))
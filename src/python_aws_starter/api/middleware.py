@@ -0,0 +1,61 @@
+"""HTTP middleware for the timeline API."""
+
+import hashlib
+from typing import Tuple, cast
+
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response, StreamingResponse
+
+# Read-only endpoints whose responses can be revalidated by the client
+CACHEABLE_PREFIXES: Tuple[str, ...] = ("/search/", "/wikidata/entity/")
+CACHE_CONTROL = "public, max-age=60"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """RFC 7232 weak comparison of an If-None-Match header against our ETag."""
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+
+class CachingMiddleware(BaseHTTPMiddleware):
+    """Add ``ETag``/``Cache-Control`` to cacheable GET responses and answer
+    matching ``If-None-Match`` requests with an empty 304.
+
+    The ETag is a hash of the response body, so identical results for a
+    repeated query revalidate without re-downloading the JSON.
+    """
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or not request.url.path.startswith(CACHEABLE_PREFIXES)
+        ):
+            return response
+
+        # call_next returns Starlette's private streaming response (typed as a plain Response)
+        streamed = cast(StreamingResponse, response)
+        body = b"".join([
+            chunk.encode(streamed.charset) if isinstance(chunk, str) else bytes(chunk)
+            async for chunk in streamed.body_iterator
+        ])
+        etag = '"%s"' % hashlib.blake2b(body, digest_size=16).hexdigest()
+        headers = dict(response.headers)
+        headers.pop("content-length", None)
+        headers["etag"] = etag
+        headers["cache-control"] = CACHE_CONTROL
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            headers.pop("content-type", None)
+            return Response(status_code=304, headers=headers, background=response.background)
+        return Response(
+            content=body, status_code=response.status_code, headers=headers, background=response.background
+        )
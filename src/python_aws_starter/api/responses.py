@@ -0,0 +1,19 @@
+"""Response classes for the timeline API."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib ``json`` module.
+
+    Defined here rather than imported from ``fastapi.responses`` because
+    FastAPI's own ``ORJSONResponse`` is deprecated in recent releases.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
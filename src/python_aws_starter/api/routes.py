@@ -1,6 +1,6 @@
 """Main API routes for the timeline application."""
 
-from typing import List, Optional
+from typing import Optional, Tuple
 from pydantic import BaseModel, Field
 
 
@@ -23,6 +23,47 @@ class APIResponse(BaseModel):
     meta: Optional[dict] = Field(None, description="Metadata (pagination, etc.)")
 
 
+class SearchFilters(BaseModel):
+    """Query parameters shared by the /search/* endpoints."""
+
+    text: Optional[str] = Field(None, description="Text to search for")
+    q: Optional[str] = Field(None, description="Alias of 'text' used by the frontend")
+
+    @property
+    def search_query(self) -> Optional[str]:
+        """'q' if provided, otherwise 'text'."""
+        return self.q or self.text
+
+
+class GeoSearchFilters(SearchFilters):
+    """Search parameters with an optional proximity filter."""
+
+    center_lat: Optional[float] = Field(None, description="Latitude of the proximity center")
+    center_lon: Optional[float] = Field(None, description="Longitude of the proximity center")
+    within_km: Optional[float] = Field(None, description="Maximum distance from the center in km")
+
+    @property
+    def center(self) -> Optional[Tuple[float, float]]:
+        """(lat, lon) when both coordinates are given."""
+        if self.center_lat is not None and self.center_lon is not None:
+            return (self.center_lat, self.center_lon)
+        return None
+
+
+class EventSearchFilters(GeoSearchFilters):
+    """Query parameters for /search/events."""
+
+    start_date: Optional[str] = Field(None, description="ISO start of the date range")
+    end_date: Optional[str] = Field(None, description="ISO end of the date range")
+    geography_id: Optional[str] = Field(None, description="Only events at this geography")
+
+
+class PeopleSearchFilters(SearchFilters):
+    """Query parameters for /search/people."""
+
+    related_event_id: Optional[str] = Field(None, description="Only people related to this event")
+
+
 # TODO: Implement route handlers
 # - GET /api/v1/events
 # - GET /api/v1/events/{id}
@@ -1,6 +1,11 @@
 """Configuration management for the timeline application."""
 
-from typing import List, Dict, Optional, Any
+import functools
+import os
+from collections import ChainMap
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Optional, Any, Mapping
 from enum import Enum
 
 
@@ -48,48 +53,60 @@ class CacheConfig:
         self.ttl_seconds = ttl_seconds
 
 
+# Built-in dimensions, shared read-only by every DimensionConfig instance
+_DEFAULT_DIMENSIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "timeline": MappingProxyType({
+        "name": "Timeline",
+        "icon": "🕐",
+        "color": "#FF6B6B",
+        "zoom_levels": ("era", "century", "decade", "year", "month", "day"),
+    }),
+    "geography": MappingProxyType({
+        "name": "Geography",
+        "icon": "🌍",
+        "color": "#4ECDC4",
+        "zoom_levels": ("continent", "country", "region", "city", "location"),
+    }),
+    "people": MappingProxyType({
+        "name": "People",
+        "icon": "👥",
+        "color": "#95E1D3",
+        "zoom_levels": ("individual", "organization", "nationality", "group"),
+    }),
+    "events": MappingProxyType({
+        "name": "Events",
+        "icon": "📍",
+        "color": "#F38181",
+        "zoom_levels": ("event", "episode", "era", "age"),
+    }),
+})
+
+
 class DimensionConfig:
     """Configuration for available dimensions."""
 
+    default_dimensions = _DEFAULT_DIMENSIONS
+
     def __init__(self):
-        self.default_dimensions = {
-            "timeline": {
-                "name": "Timeline",
-                "icon": "🕐",
-                "color": "#FF6B6B",
-                "zoom_levels": ["era", "century", "decade", "year", "month", "day"],
-            },
-            "geography": {
-                "name": "Geography",
-                "icon": "🌍",
-                "color": "#4ECDC4",
-                "zoom_levels": ["continent", "country", "region", "city", "location"],
-            },
-            "people": {
-                "name": "People",
-                "icon": "👥",
-                "color": "#95E1D3",
-                "zoom_levels": ["individual", "organization", "nationality", "group"],
-            },
-            "events": {
-                "name": "Events",
-                "icon": "📍",
-                "color": "#F38181",
-                "zoom_levels": ["event", "episode", "era", "age"],
-            },
-        }
+        # Custom dimensions only; the built-ins are never copied per instance
+        self._custom: Dict[str, Any] = {}
+        # Live read-only view: custom entries shadow the defaults, nothing is merged per call
+        self._all: Mapping[str, Any] = MappingProxyType(ChainMap(self._custom, _DEFAULT_DIMENSIONS))
 
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """Get all dimension configurations."""
-        return self.default_dimensions
+        return self._all
 
-    def get(self, dimension_id: str) -> Optional[Dict[str, Any]]:
+    def get(self, dimension_id: str) -> Optional[Mapping[str, Any]]:
         """Get a specific dimension configuration."""
-        return self.default_dimensions.get(dimension_id)
+        custom = self._custom.get(dimension_id)
+        if custom is not None:
+            return custom
+        return _DEFAULT_DIMENSIONS.get(dimension_id)
 
     def add_custom(self, dimension_id: str, config: Dict[str, Any]) -> None:
         """Add a custom dimension configuration."""
-        self.default_dimensions[dimension_id] = config
+        self._custom[dimension_id] = config
 
 
 class ApplicationConfig:
@@ -105,6 +122,7 @@ class ApplicationConfig:
         data_log_body_max: int = 1000,
         data_source: str = "local",
         log_level: str = "INFO",
+        workers: int = 1,
     ):
         self.environment = environment
         self.debug = debug
@@ -130,61 +148,137 @@ class ApplicationConfig:
         # Wikidata response body logging
         self.wikidata_log_body = wikidata_log_body
         self.data_log_body_max = data_log_body_max
+        # Uvicorn worker processes; keep 1 when the orchestrator scales containers
+        self.workers = workers
 
     @classmethod
+    @functools.lru_cache(maxsize=1)
     def from_env(cls) -> "ApplicationConfig":
-        """Load configuration from environment variables."""
-        import os
+        """Load configuration from environment variables.
 
-        env = Environment(os.getenv("ENVIRONMENT", "development"))
-        debug = os.getenv("DEBUG", "false").lower() == "true"
+        The result is cached; call :meth:`reload` to re-read the environment.
+        """
+        settings = _load_env_config()
 
         db = DatabaseConfig(
-            host=os.getenv("DB_HOST", "localhost"),
-            port=int(os.getenv("DB_PORT", "5432")),
-            username=os.getenv("DB_USER", "timeline_user"),
-            password=os.getenv("DB_PASSWORD", "changeme"),
-            database=os.getenv("DB_NAME", "timeline_db"),
-            engine=os.getenv("DB_ENGINE", "postgresql"),
+            host=settings.db_host,
+            port=settings.db_port,
+            username=settings.db_user,
+            password=settings.db_password,
+            database=settings.db_name,
+            engine=settings.db_engine,
         )
 
         cache = CacheConfig(
-            enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
-            host=os.getenv("CACHE_HOST", "localhost"),
-            port=int(os.getenv("CACHE_PORT", "6379")),
-            ttl_seconds=int(os.getenv("CACHE_TTL", "3600")),
+            enabled=settings.cache_enabled,
+            host=settings.cache_host,
+            port=settings.cache_port,
+            ttl_seconds=settings.cache_ttl,
         )
 
-        # data source selection
-        data_source = os.getenv("DATA_SOURCE", "local")
-
-        # wikidata settings
-        wikidata_limit = int(os.getenv("WIKIDATA_LIMIT", "10"))
-        wikidata_base = os.getenv("WIKIDATA_API_BASE", "https://www.wikidata.org/w/api.php")
-        wikidata_entity = os.getenv("WIKIDATA_ENTITY_BASE", "https://www.wikidata.org/wiki/Special:EntityData/")
-        
-        # logging settings
-        log_level = os.getenv("LOG_LEVEL", "DEBUG" if debug else "INFO")
-        
-        # wikidata body logging settings
-        wikidata_log_body = os.getenv("WIKIDATA_LOG_BODY", "false").lower() == "true"
-        data_log_body_max = int(os.getenv("DATA_LOG_BODY_MAX", "1000"))
-
         inst = cls(
-            environment=env,
-            debug=debug,
+            environment=settings.environment,
+            debug=settings.debug,
             database=db,
             cache=cache,
-            wikidata_log_body=wikidata_log_body,
-            data_log_body_max=data_log_body_max,
-            data_source=data_source,
-            log_level=log_level,
+            wikidata_log_body=settings.wikidata_log_body,
+            data_log_body_max=settings.data_log_body_max,
+            data_source=settings.data_source,
+            log_level=settings.log_level,
+            workers=settings.workers,
         )
-        inst.wikidata_api["limit"] = wikidata_limit
-        inst.wikidata_api["base_url"] = wikidata_base
-        inst.wikidata_api["entity_url"] = wikidata_entity
+        inst.wikidata_api["limit"] = settings.wikidata_limit
+        inst.wikidata_api["base_url"] = settings.wikidata_base
+        inst.wikidata_api["entity_url"] = settings.wikidata_entity
         return inst
 
+    @classmethod
+    def reload(cls) -> "ApplicationConfig":
+        """Re-read the environment and return a fresh configuration.
+
+        Modules holding the global ``config`` keep the instance they imported.
+        """
+        _load_env_config.cache_clear()
+        cls.from_env.cache_clear()
+        return cls.from_env()
+
+
+@dataclass(frozen=True)
+class _EnvSettings:
+    """Parsed environment variables backing :meth:`ApplicationConfig.from_env`."""
+
+    environment: Environment
+    debug: bool
+    db_host: str
+    db_port: int
+    db_user: str
+    db_password: str
+    db_name: str
+    db_engine: str
+    cache_enabled: bool
+    cache_host: str
+    cache_port: int
+    cache_ttl: int
+    data_source: str
+    wikidata_limit: int
+    wikidata_base: str
+    wikidata_entity: str
+    log_level: str
+    wikidata_log_body: bool
+    data_log_body_max: int
+    workers: int
+
+
+# Accepted spellings for boolean env flags; a set lookup instead of lowering each value
+def _env_flag(env: Mapping[str, str], name: str, default: bool) -> bool:
+    """Parse a boolean environment flag ('true' in any case), falling back to ``default`` when unset."""
+    value = env.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() == "true"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_config() -> _EnvSettings:
+    """Read and parse the environment once."""
+    env = os.environ
+    debug = _env_flag(env, "DEBUG", False)
+    return _EnvSettings(
+        environment=Environment(env.get("ENVIRONMENT", "development")),
+        debug=debug,
+        db_host=env.get("DB_HOST", "localhost"),
+        db_port=int(env.get("DB_PORT", "5432")),
+        db_user=env.get("DB_USER", "timeline_user"),
+        db_password=env.get("DB_PASSWORD", "changeme"),
+        db_name=env.get("DB_NAME", "timeline_db"),
+        db_engine=env.get("DB_ENGINE", "postgresql"),
+        cache_enabled=_env_flag(env, "CACHE_ENABLED", True),
+        cache_host=env.get("CACHE_HOST", "localhost"),
+        cache_port=int(env.get("CACHE_PORT", "6379")),
+        cache_ttl=int(env.get("CACHE_TTL", "3600")),
+        # data source selection
+        data_source=env.get("DATA_SOURCE", "local"),
+        # wikidata settings
+        wikidata_limit=int(env.get("WIKIDATA_LIMIT", "10")),
+        wikidata_base=env.get("WIKIDATA_API_BASE", "https://www.wikidata.org/w/api.php"),
+        wikidata_entity=env.get("WIKIDATA_ENTITY_BASE", "https://www.wikidata.org/wiki/Special:EntityData/"),
+        # logging settings
+        log_level=env.get("LOG_LEVEL", "DEBUG" if debug else "INFO"),
+        # wikidata body logging settings
+        wikidata_log_body=_env_flag(env, "WIKIDATA_LOG_BODY", False),
+        data_log_body_max=int(env.get("DATA_LOG_BODY_MAX", "1000")),
+        # server settings
+        workers=int(env.get("WORKERS", "1")),
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Build the global ``config`` on first access rather than at import time.
 
-# Global configuration instance
-config = ApplicationConfig.from_env()
+    Importing only types such as :class:`Environment` no longer parses the
+    environment. ``from_env`` is cached, so every access returns the same
+    instance until :meth:`ApplicationConfig.reload` is called.
+    """
+    if name == "config":
+        return ApplicationConfig.from_env()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
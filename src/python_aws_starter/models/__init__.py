@@ -1,29 +1,67 @@
-"""Data models for the timeline application."""
-
-from .base import BaseEntity
-from .sources import DataSource, SourceAttribution
-from .events import Event
-from .people import Person
-from .geography import Geography, GeographicReference
-from .dimensions import Dimension
-from .validation import DataQuality
-from .contributions import UserContribution
-from .wikidata_meta import (
-    Claim,
-    Statement,
-    Snak,
-    Datavalue,
-    DatavalueType,
-    SnakType,
-    TimeValue,
-    QuantityValue,
-    GlobeCoordinate,
-    MonolingualText,
-    WikibaseEntityId,
-    Reference,
-    Qualifier,
-    WikibaseEntity,
-)
+"""Data models for the timeline application.
+
+Models are imported on first attribute access (PEP 562), so importing the
+package, or one submodule of it, doesn't build every pydantic schema.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "BaseEntity": ".base",
+    "DataSource": ".sources",
+    "SourceAttribution": ".sources",
+    "Event": ".events",
+    "Person": ".people",
+    "Geography": ".geography",
+    "GeographicReference": ".references",
+    "Dimension": ".dimensions",
+    "DataQuality": ".validation",
+    "UserContribution": ".contributions",
+    # Wikidata meta model
+    "Claim": ".wikidata_meta",
+    "Statement": ".wikidata_meta",
+    "Snak": ".wikidata_meta",
+    "Datavalue": ".wikidata_meta",
+    "DatavalueType": ".wikidata_meta",
+    "SnakType": ".wikidata_meta",
+    "TimeValue": ".wikidata_meta",
+    "QuantityValue": ".wikidata_meta",
+    "GlobeCoordinate": ".wikidata_meta",
+    "MonolingualText": ".wikidata_meta",
+    "WikibaseEntityId": ".wikidata_meta",
+    "Reference": ".wikidata_meta",
+    "Qualifier": ".wikidata_meta",
+    "WikibaseEntity": ".wikidata_meta",
+}
+
+if TYPE_CHECKING:
+    from .base import BaseEntity
+    from .sources import DataSource, SourceAttribution
+    from .events import Event
+    from .people import Person
+    from .geography import Geography
+    from .references import GeographicReference
+    from .dimensions import Dimension
+    from .validation import DataQuality
+    from .contributions import UserContribution
+    from .wikidata_meta import (
+        Claim,
+        Statement,
+        Snak,
+        Datavalue,
+        DatavalueType,
+        SnakType,
+        TimeValue,
+        QuantityValue,
+        GlobeCoordinate,
+        MonolingualText,
+        WikibaseEntityId,
+        Reference,
+        Qualifier,
+        WikibaseEntity,
+    )
 
 __all__ = [
     "BaseEntity",
@@ -52,3 +90,17 @@ __all__ = [
     "Qualifier",
     "WikibaseEntity",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    obj = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = obj  # cache so later lookups skip __getattr__
+    return obj
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,9 +2,18 @@
 
 from datetime import datetime, timezone
 from typing import Optional, Dict, List
-from pydantic import BaseModel, Field, ConfigDict
-from .wikidata_meta import Claim, EntityLabels, EntityDescriptions
+from pydantic import BaseModel, Field, ConfigDict, field_serializer
+from .wikidata_meta import Claim, InternedStr, best_claim
 
+# Settings for models built in bulk (one per Wikidata entity). These are the
+# pydantic v2 defaults, pinned so nested model instances keep being stored by
+# reference (no revalidation/copy) and assignment stays unchecked.
+BULK_MODEL_CONFIG = ConfigDict(
+    validate_assignment=False,
+    revalidate_instances="never",
+    extra="ignore",
+    frozen=False,
+)
 
 class BaseEntity(BaseModel):
     """Base entity model with common fields for all domain models.
@@ -17,10 +26,11 @@ class BaseEntity(BaseModel):
     created_by: str = Field(..., description="User or system that created this entity")
     last_modified_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
     last_modified_by: str = Field(..., description="User or system that last modified this entity")
-    metadata: Optional[dict] = Field(default_factory=dict, description="Additional metadata")
+    # Unset metadata stays None (no dict per entity) but is still sent as {}
+    metadata: Optional[dict] = Field(None, description="Additional metadata")
     
     # Wikidata-style claims structure
-    claims: Dict[str, List[Claim]] = Field(
+    claims: Dict[InternedStr, List[Claim]] = Field(
         default_factory=dict,
         description="Claims by property ID (Wikidata-style: property -> list of claims)"
     )
@@ -37,6 +47,11 @@ class BaseEntity(BaseModel):
         description="Aliases by language code"
     )
     
+    @field_serializer("metadata")
+    def _serialize_metadata(self, metadata: Optional[dict]) -> dict:
+        """Unset metadata serializes as ``{}``, as it did when it defaulted to a dict."""
+        return metadata if metadata is not None else {}
+
     def get_label(self, lang: str = "en") -> str:
         """Get label in specified language."""
         label_data = self.labels.get(lang, {})
@@ -53,24 +68,10 @@ class BaseEntity(BaseModel):
     
     def get_best_claim(self, property_id: str) -> Optional[Claim]:
         """Get the best (preferred or first normal) claim for a property."""
-        claims = self.get_claims(property_id)
-        if not claims:
-            return None
-        
-        # Prefer preferred rank
-        for claim in claims:
-            if claim.rank == "preferred":
-                return claim
-        
-        # Fall back to first normal rank
-        for claim in claims:
-            if claim.rank == "normal":
-                return claim
-        
-        # Last resort: return first claim
-        return claims[0] if claims else None
+        return best_claim(self.claims.get(property_id, ()))
 
     model_config = ConfigDict(
+        **BULK_MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "entity_001",
@@ -1,7 +1,11 @@
 """Utility functions for working with Wikidata-style claims."""
 
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import functools
+import re
+import sys
+from typing import Final, Optional, Any, Tuple, Union
+from datetime import date
+
 from .wikidata_meta import (
     Claim,
     Snak,
@@ -11,77 +15,86 @@ from .wikidata_meta import (
     TimeValue,
     WikibaseEntityId,
     GlobeCoordinate,
-)
-from .property_synonyms import (
-    START_DATE_PROPERTY_IDS,
-    END_DATE_PROPERTY_IDS,
-    get_start_date_properties,
-    get_end_date_properties,
-    is_start_date_property,
-    is_end_date_property,
+    GREGORIAN_CALENDAR_URI,
+    EARTH_GLOBE_URI,
 )
 
 
 # Common Wikidata property IDs
 class Property:
-    """Common Wikidata property IDs."""
+    """Common Wikidata property IDs (interned, shared with claim keys)."""
     
     # Person properties
-    DATE_OF_BIRTH = "P569"
-    DATE_OF_DEATH = "P570"
-    PLACE_OF_BIRTH = "P19"
-    PLACE_OF_DEATH = "P20"
-    OCCUPATION = "P106"
-    COUNTRY_OF_CITIZENSHIP = "P27"
-    INSTANCE_OF = "P31"
+    DATE_OF_BIRTH: Final = sys.intern("P569")
+    DATE_OF_DEATH: Final = sys.intern("P570")
+    PLACE_OF_BIRTH: Final = sys.intern("P19")
+    PLACE_OF_DEATH: Final = sys.intern("P20")
+    OCCUPATION: Final = sys.intern("P106")
+    COUNTRY_OF_CITIZENSHIP: Final = sys.intern("P27")
+    INSTANCE_OF: Final = sys.intern("P31")
     
     # Event properties
-    START_TIME = "P580"
-    END_TIME = "P582"
-    POINT_IN_TIME = "P585"
-    LOCATION = "P276"
-    INCEPTION = "P571"
+    START_TIME: Final = sys.intern("P580")
+    END_TIME: Final = sys.intern("P582")
+    POINT_IN_TIME: Final = sys.intern("P585")
+    LOCATION: Final = sys.intern("P276")
+    INCEPTION: Final = sys.intern("P571")
     
     # Geography properties
-    COORDINATE_LOCATION = "P625"
+    COORDINATE_LOCATION: Final = sys.intern("P625")
     
     # Common properties
-    LABEL = "P1"  # Not a real property, but used for labels
-    DESCRIPTION = "P2"  # Not a real property, but used for descriptions
+    LABEL: Final = sys.intern("P1")  # Not a real property, but used for labels
+    DESCRIPTION: Final = sys.intern("P2")  # Not a real property, but used for descriptions
 
 
-def create_time_claim(property_id: str, date_str: str, precision: int = 11) -> Claim:
-    """Create a time claim from an ISO date string.
-    
-    Args:
-        property_id: Property ID (e.g., P569 for date of birth)
-        date_str: ISO 8601 date string (e.g., "1769-08-15")
-        precision: Precision level (9=year, 10=month, 11=day)
-    
-    Returns:
-        Claim with time datavalue
+DateLike = Union[str, date]
+
+
+def _wikidata_time(date_str: DateLike) -> str:
+    """Convert an ISO date to Wikidata time format ('1769-08-15' -> '+1769-08-15T00:00:00Z').
+
+    ``date``/``datetime`` objects are formatted directly (time of day is dropped);
+    strings already in Wikidata form ('+1769-08-15T00:00:00Z') pass through untouched.
     """
-    # Convert ISO date to Wikidata time format
-    if not date_str.startswith("+"):
-        time_str = f"+{date_str}T00:00:00Z"
-    else:
-        time_str = f"{date_str}T00:00:00Z" if "T" not in date_str else date_str
-    
+    if not isinstance(date_str, str):
+        return f"+{date_str.year:04d}-{date_str.month:02d}-{date_str.day:02d}T00:00:00Z"
+    if date_str[:1] not in ("+", "-"):
+        return f"+{date_str}T00:00:00Z"
+    return f"{date_str}T00:00:00Z" if "T" not in date_str else date_str
+
+
+@functools.lru_cache(maxsize=4096)
+def _time_datavalue(time_str: str, precision: int) -> Datavalue:
+    """Shared (frozen) datavalue for a Wikidata time; years and common dates repeat across claims."""
     time_value = TimeValue(
         time=time_str,
         precision=precision,
-        calendarmodel="http://www.wikidata.org/entity/Q1985727"
+        calendarmodel=GREGORIAN_CALENDAR_URI
     )
     
-    datavalue = Datavalue(
+    return Datavalue(
         type=DatavalueType.TIME,
         value=time_value
     )
+
+
+def create_time_claim(property_id: str, date_str: DateLike, precision: int = 11) -> Claim:
+    """Create a time claim from an ISO date string or a ``date``/``datetime``.
+    
+    Args:
+        property_id: Property ID (e.g., P569 for date of birth)
+        date_str: ISO 8601 date string (e.g., "1769-08-15"), a Wikidata time
+            string (e.g., "+1769-08-15T00:00:00Z") or a ``date``/``datetime``
+        precision: Precision level (9=year, 10=month, 11=day)
     
+    Returns:
+        Claim with time datavalue
+    """
     snak = Snak(
         snaktype=SnakType.VALUE,
-        property=property_id,
-        datavalue=datavalue
+        property=sys.intern(property_id),
+        datavalue=_time_datavalue(_wikidata_time(date_str), precision)
     )
     
     return Claim(
@@ -91,6 +104,20 @@ def create_time_claim(property_id: str, date_str: str, precision: int = 11) -> C
     )
 
 
+@functools.lru_cache(maxsize=4096)
+def _entity_datavalue(entity_id: str, entity_type: str) -> Datavalue:
+    """Shared (frozen) datavalue for an entity reference; targets like Q5 repeat across millions of claims."""
+    entity_value = WikibaseEntityId(
+        id=entity_id,
+        entity_type=entity_type
+    )
+    
+    return Datavalue(
+        type=DatavalueType.WIKIBASE_ENTITY,
+        value=entity_value
+    )
+
+
 def create_entity_claim(property_id: str, entity_id: str, entity_type: str = "item") -> Claim:
     """Create a claim with an entity reference.
     
@@ -102,20 +129,10 @@ def create_entity_claim(property_id: str, entity_id: str, entity_type: str = "it
     Returns:
         Claim with entity datavalue
     """
-    entity_value = WikibaseEntityId(
-        id=entity_id,
-        entity_type=entity_type
-    )
-    
-    datavalue = Datavalue(
-        type=DatavalueType.WIKIBASE_ENTITY,
-        value=entity_value
-    )
-    
     snak = Snak(
         snaktype=SnakType.VALUE,
-        property=property_id,
-        datavalue=datavalue
+        property=sys.intern(property_id),
+        datavalue=_entity_datavalue(entity_id, entity_type)
     )
     
     return Claim(
@@ -142,7 +159,7 @@ def create_string_claim(property_id: str, value: str) -> Claim:
     
     snak = Snak(
         snaktype=SnakType.VALUE,
-        property=property_id,
+        property=sys.intern(property_id),
         datavalue=datavalue
     )
     
@@ -167,7 +184,7 @@ def create_coordinate_claim(property_id: str, latitude: float, longitude: float)
     coord_value = GlobeCoordinate(
         latitude=latitude,
         longitude=longitude,
-        globe="http://www.wikidata.org/entity/Q2"
+        globe=EARTH_GLOBE_URI
     )
     
     datavalue = Datavalue(
@@ -177,7 +194,7 @@ def create_coordinate_claim(property_id: str, latitude: float, longitude: float)
     
     snak = Snak(
         snaktype=SnakType.VALUE,
-        property=property_id,
+        property=sys.intern(property_id),
         datavalue=datavalue
     )
     
@@ -188,6 +205,45 @@ def create_coordinate_claim(property_id: str, latitude: float, longitude: float)
     )
 
 
+def _time_value(time_value: Any) -> Optional[str]:
+    if type(time_value) is TimeValue:
+        time_str = time_value.time
+        # Remove + and T00:00:00Z with a single slice
+        start = 1 if time_str[:1] == "+" else 0
+        t = time_str.find("T")
+        return time_str[start:t] if t >= 0 else time_str[start:]
+    return None
+
+
+def _entity_id_value(entity_value: Any) -> Optional[str]:
+    if type(entity_value) is WikibaseEntityId:
+        return entity_value.id
+    return None
+
+
+def _string_value(value: Any) -> Optional[str]:
+    return str(value)
+
+
+def _coordinate_value(coord_value: Any) -> Optional[Tuple[float, float]]:
+    if type(coord_value) is GlobeCoordinate:
+        return (coord_value.latitude, coord_value.longitude)
+    return None
+
+
+# Shape of an ISO 8601 date (optionally signed/time-suffixed, and with the
+# 5+ digit years Wikidata uses for deep time); a C-speed pre-check before a
+# claim's time string is used as a date
+_ISO8601_RE = re.compile(r"[+-]?\d{4,}(?:-\d{1,2}(?:-\d{1,2}(?:[T ]\d{1,2}(?::\d{1,2}){0,2})?)?)?$")
+
+
+def is_iso_date(date_str: Optional[str]) -> bool:
+    """Whether ``date_str`` looks like an ISO 8601 date ('1815', '1815-06-18', '-0044-03-15', '-10000-00-00')."""
+    if not date_str:
+        return False
+    return _ISO8601_RE.match(date_str) is not None
+
+
 def extract_time_from_claim(claim: Claim) -> Optional[str]:
     """Extract ISO date string from a time claim.
     
@@ -197,23 +253,10 @@ def extract_time_from_claim(claim: Claim) -> Optional[str]:
     Returns:
         ISO date string or None
     """
-    if not claim.mainsnak.datavalue:
+    datavalue = claim.mainsnak.datavalue
+    if datavalue is None or datavalue.type != DatavalueType.TIME:
         return None
-    
-    if claim.mainsnak.datavalue.type != DatavalueType.TIME:
-        return None
-    
-    time_value = claim.mainsnak.datavalue.value
-    if isinstance(time_value, TimeValue):
-        time_str = time_value.time
-        # Remove + and T00:00:00Z
-        if time_str.startswith("+"):
-            time_str = time_str[1:]
-        if "T" in time_str:
-            time_str = time_str.split("T")[0]
-        return time_str
-    
-    return None
+    return _time_value(datavalue.value)
 
 
 def extract_entity_id_from_claim(claim: Claim) -> Optional[str]:
@@ -225,17 +268,10 @@ def extract_entity_id_from_claim(claim: Claim) -> Optional[str]:
     Returns:
         Entity ID or None
     """
-    if not claim.mainsnak.datavalue:
+    datavalue = claim.mainsnak.datavalue
+    if datavalue is None or datavalue.type != DatavalueType.WIKIBASE_ENTITY:
         return None
-    
-    if claim.mainsnak.datavalue.type != DatavalueType.WIKIBASE_ENTITY:
-        return None
-    
-    entity_value = claim.mainsnak.datavalue.value
-    if isinstance(entity_value, WikibaseEntityId):
-        return entity_value.id
-    
-    return None
+    return _entity_id_value(datavalue.value)
 
 
 def extract_string_from_claim(claim: Claim) -> Optional[str]:
@@ -247,16 +283,13 @@ def extract_string_from_claim(claim: Claim) -> Optional[str]:
     Returns:
         String value or None
     """
-    if not claim.mainsnak.datavalue:
-        return None
-    
-    if claim.mainsnak.datavalue.type != DatavalueType.STRING:
+    datavalue = claim.mainsnak.datavalue
+    if datavalue is None or datavalue.type != DatavalueType.STRING:
         return None
-    
-    return str(claim.mainsnak.datavalue.value)
+    return _string_value(datavalue.value)
 
 
-def extract_coordinate_from_claim(claim: Claim) -> Optional[tuple]:
+def extract_coordinate_from_claim(claim: Claim) -> Optional[Tuple[float, float]]:
     """Extract (latitude, longitude) from a coordinate claim.
     
     Args:
@@ -265,14 +298,7 @@ def extract_coordinate_from_claim(claim: Claim) -> Optional[tuple]:
     Returns:
         Tuple of (latitude, longitude) or None
     """
-    if not claim.mainsnak.datavalue:
-        return None
-    
-    if claim.mainsnak.datavalue.type != DatavalueType.GLOBE_COORDINATE:
+    datavalue = claim.mainsnak.datavalue
+    if datavalue is None or datavalue.type != DatavalueType.GLOBE_COORDINATE:
         return None
-    
-    coord_value = claim.mainsnak.datavalue.value
-    if isinstance(coord_value, GlobeCoordinate):
-        return (coord_value.latitude, coord_value.longitude)
-    
-    return None
+    return _coordinate_value(datavalue.value)
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field, ConfigDict
+from .base import BULK_MODEL_CONFIG
 
 
 class ContributionType(str, Enum):
@@ -73,6 +74,7 @@ class UserContribution(BaseModel):
     merged_at: Optional[datetime] = Field(None, description="When was this merged?")
 
     model_config = ConfigDict(
+        **BULK_MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "contrib_001",
@@ -1,11 +1,44 @@
 """Models for historical and geographical events."""
 
-from datetime import datetime
-from typing import List, Optional
+import functools
+from datetime import date
+from typing import Optional, Sequence, Tuple
 from pydantic import BaseModel, Field, ConfigDict
 from .base import BaseEntity
 from .sources import SourceAttribution
-from .claims_utils import Property, extract_time_from_claim, extract_entity_id_from_claim, extract_coordinate_from_claim
+from .references import GeographicReference
+from .claims_utils import Property, extract_time_from_claim, is_iso_date, extract_entity_id_from_claim
+from .property_synonyms import START_DATE_PROPERTY_ORDER, END_DATE_PROPERTY_ORDER
+
+
+@functools.lru_cache(maxsize=4096)
+def _date_precision(date_str: str) -> str:
+    """Precision ('day', 'month' or 'year') of a date extracted from a time claim.
+    
+    Wikidata zero-fills the parts it doesn't know ('1815-00-00' is a year),
+    so string length alone can't tell them apart.
+    """
+    try:
+        date.fromisoformat(date_str)
+        return "day"
+    except ValueError:
+        pass
+    parts = date_str.lstrip("+-").split("-")
+    if len(parts) >= 3 and parts[2].strip("0"):
+        return "day"
+    if len(parts) >= 2 and parts[1].strip("0"):
+        return "month"
+    return "year"
+
+
+@functools.lru_cache(maxsize=4096)
+def _location_reference(entity_id: str) -> GeographicReference:
+    """Shared (frozen) reference for a P276 target; many events point at the same places."""
+    # TODO: Resolve entity to get name and coordinates
+    return GeographicReference(
+        geography_id=f"geo_{entity_id}",
+        name=entity_id  # Would need entity resolution
+    )
 
 
 class DateRange(BaseModel):
@@ -25,7 +58,18 @@ class DateRange(BaseModel):
                 "end_date": "1945-09-02",
                 "precision": "day",
             }
-        }
+        },
+        frozen=True,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _claim_date_range(date_str: str, is_end: bool) -> DateRange:
+    """Shared (frozen) DateRange for a claim date; the same dates recur across many entities."""
+    return DateRange(
+        start_date=date_str,
+        end_date=date_str if is_end else None,
+        precision=_date_precision(date_str),
     )
 
 
@@ -36,14 +80,7 @@ class PersonReference(BaseModel):
     name: str = Field(..., description="Person's name")
     role: Optional[str] = Field(None, description="Role in this event")
 
-
-class GeographicReference(BaseModel):
-    """Reference to a geographic location related to this event."""
-
-    geography_id: str = Field(..., description="Reference to Geography.id")
-    name: str = Field(..., description="Geographic name")
-    latitude: Optional[float] = Field(None, description="Latitude coordinate")
-    longitude: Optional[float] = Field(None, description="Longitude coordinate")
+    model_config = ConfigDict(frozen=True)
 
 
 class Event(BaseEntity):
@@ -57,11 +94,11 @@ class Event(BaseEntity):
     description: str = Field(..., description="Detailed description - computed from claims if available")
     start_date: DateRange = Field(..., description="When the event started - computed from claims if available")
     end_date: Optional[DateRange] = Field(None, description="When the event ended - computed from claims if available")
-    locations: List[GeographicReference] = Field(
-        default_factory=list, description="Geographic locations - computed from claims if available"
+    locations: Tuple[GeographicReference, ...] = Field(
+        default_factory=tuple, description="Geographic locations - computed from claims if available"
     )
-    related_people: List[PersonReference] = Field(
-        default_factory=list, description="People associated with this event - computed from claims if available"
+    related_people: Tuple[PersonReference, ...] = Field(
+        default_factory=tuple, description="People associated with this event - computed from claims if available"
     )
     
     def get_computed_title(self) -> str:
@@ -76,48 +113,39 @@ class Event(BaseEntity):
     
     def get_computed_start_date(self) -> DateRange:
         """Get start date from claims using property synonyms configuration."""
-        from python_aws_starter.models.property_synonyms import get_start_date_properties
-        
         # Try all start date synonyms in priority order
-        for prop_id in get_start_date_properties():
+        for prop_id in START_DATE_PROPERTY_ORDER:
             claim = self.get_best_claim(prop_id)
             if claim:
                 date_str = extract_time_from_claim(claim)
-                if date_str:
-                    return DateRange(start_date=date_str, precision="day" if len(date_str) >= 10 else "year")
+                if is_iso_date(date_str):
+                    return _claim_date_range(date_str, False)
         
         return self.start_date
     
     def get_computed_end_date(self) -> Optional[DateRange]:
         """Get end date from claims using property synonyms configuration."""
-        from python_aws_starter.models.property_synonyms import get_end_date_properties
-        
         # Try all end date synonyms in priority order
-        for prop_id in get_end_date_properties():
+        for prop_id in END_DATE_PROPERTY_ORDER:
             claim = self.get_best_claim(prop_id)
             if claim:
                 date_str = extract_time_from_claim(claim)
-                if date_str:
-                    return DateRange(start_date=date_str, end_date=date_str, precision="day" if len(date_str) >= 10 else "year")
+                if is_iso_date(date_str):
+                    return _claim_date_range(date_str, True)
         return self.end_date
     
-    def get_locations_from_claims(self) -> List[GeographicReference]:
+    def get_locations_from_claims(self) -> Sequence[GeographicReference]:
         """Get locations from claims (P276)."""
-        location_claims = self.get_claims(Property.LOCATION)
-        locations = []
-        for claim in location_claims:
-            entity_id = extract_entity_id_from_claim(claim)
-            if entity_id:
-                # TODO: Resolve entity to get name and coordinates
-                locations.append(GeographicReference(
-                    geography_id=f"geo_{entity_id}",
-                    name=entity_id  # Would need entity resolution
-                ))
+        locations = [
+            _location_reference(entity_id)
+            for entity_id in map(extract_entity_id_from_claim, self.get_claims(Property.LOCATION))
+            if entity_id
+        ]
         return locations if locations else self.locations
-    
+
     # Multi-source tracking
-    sources: List[SourceAttribution] = Field(
-        default_factory=list, description="Which sources contributed data"
+    sources: Tuple[SourceAttribution, ...] = Field(
+        default_factory=tuple, description="Which sources contributed data"
     )
     source_of_truth: Optional[str] = Field(
         None, description="Primary source when conflicts exist"
@@ -1,10 +1,12 @@
 """Models for geographic entities and locations."""
 
-from typing import List, Optional
+from typing import Dict, Optional, Sequence, Tuple
 from enum import Enum
+
 from pydantic import BaseModel, Field, ConfigDict
 from .base import BaseEntity
 from .sources import SourceAttribution
+from .references import GeographicReference  # noqa: F401 (re-exported)
 from .claims_utils import Property, extract_coordinate_from_claim, extract_entity_id_from_claim
 
 
@@ -23,6 +25,15 @@ class GeographyType(str, Enum):
     OTHER = "other"
 
 
+# Wikidata P31 (instance of) targets -> GeographyType
+_WIKIDATA_GEOGRAPHY_TYPES: Dict[Optional[str], GeographyType] = {
+    "Q6256": GeographyType.COUNTRY,
+    "Q515": GeographyType.CITY,  # city
+    "Q15284": GeographyType.CITY,  # settlement
+    "Q5107": GeographyType.CONTINENT,
+}
+
+
 class Coordinate(BaseModel):
     """Geographic coordinate."""
 
@@ -30,6 +41,8 @@ class Coordinate(BaseModel):
     longitude: float = Field(..., ge=-180, le=180, description="Longitude")
     elevation: Optional[float] = Field(None, description="Elevation in meters")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class TemporalGeography(BaseModel):
     """Geographic information that changes over time."""
@@ -37,18 +50,11 @@ class TemporalGeography(BaseModel):
     period_start: str = Field(..., description="Start date (ISO 8601)")
     period_end: Optional[str] = Field(None, description="End date (ISO 8601)")
     name: str = Field(..., description="Name during this period")
-    alternate_names: List[str] = Field(default_factory=list, description="Alternate names")
+    alternate_names: Tuple[str, ...] = Field(default_factory=tuple, description="Alternate names")
     ruling_entity: Optional[str] = Field(None, description="Ruling country/empire")
     boundaries: Optional[dict] = Field(None, description="Geographic boundaries/geojson")
 
-
-class GeographicReference(BaseModel):
-    """Simple reference to a geographic location."""
-
-    geography_id: str = Field(..., description="Reference to Geography.id")
-    name: str = Field(..., description="Geographic name")
-    latitude: Optional[float] = Field(None, description="Latitude coordinate")
-    longitude: Optional[float] = Field(None, description="Longitude coordinate")
+    model_config = ConfigDict(frozen=True)
 
 
 class Geography(BaseEntity):
@@ -60,7 +66,7 @@ class Geography(BaseEntity):
 
     name: str = Field(..., description="Current or primary name (or use labels from claims)")
     geography_type: GeographyType = Field(..., description="Type of geographic entity - computed from claims if available")
-    alternate_names: List[str] = Field(default_factory=list, description="Alternate or historical names - from aliases if available")
+    alternate_names: Tuple[str, ...] = Field(default_factory=tuple, description="Alternate or historical names - from aliases if available")
     
     description: str = Field(..., description="Description of the geography - computed from claims if available")
     
@@ -72,8 +78,8 @@ class Geography(BaseEntity):
     parent_geography_id: Optional[str] = Field(
         None, description="Parent geography - computed from claims if available"
     )
-    child_geographies: List[str] = Field(
-        default_factory=list, description="List of child geography IDs"
+    child_geographies: Tuple[str, ...] = Field(
+        default_factory=tuple, description="List of child geography IDs"
     )
     
     def get_computed_name(self) -> str:
@@ -96,33 +102,27 @@ class Geography(BaseEntity):
                 return Coordinate(latitude=lat, longitude=lon)
         return self.center_coordinate
     
-    def get_computed_alternate_names(self) -> List[str]:
-        """Get alternate names from aliases if available."""
-        aliases = []
-        for lang_aliases in self.aliases.values():
-            for alias in lang_aliases:
-                if isinstance(alias, dict) and "value" in alias:
-                    aliases.append(alias["value"])
+    def get_computed_alternate_names(self) -> Sequence[str]:
+        """Get alternate names from aliases if available (deduplicated across languages, first seen wins)."""
+        aliases = list(dict.fromkeys(
+            alias["value"]
+            for lang_aliases in self.aliases.values()
+            for alias in lang_aliases
+            if type(alias) is dict and "value" in alias
+        ))
         return aliases if aliases else self.alternate_names
     
     def get_geography_type_from_claims(self) -> GeographyType:
         """Get geography type from claims (P31: instance of)."""
-        instance_claims = self.get_claims(Property.INSTANCE_OF)
-        for claim in instance_claims:
-            entity_id = extract_entity_id_from_claim(claim)
-            if entity_id:
-                # Map common Wikidata types to GeographyType
-                if entity_id == "Q6256":  # country
-                    return GeographyType.COUNTRY
-                elif entity_id in ["Q515", "Q15284"]:  # city, settlement
-                    return GeographyType.CITY
-                elif entity_id == "Q5107":  # continent
-                    return GeographyType.CONTINENT
+        for claim in self.get_claims(Property.INSTANCE_OF):
+            geography_type = _WIKIDATA_GEOGRAPHY_TYPES.get(extract_entity_id_from_claim(claim))
+            if geography_type is not None:
+                return geography_type
         return self.geography_type
-    
+
     # Temporal variations
-    temporal_variants: List[TemporalGeography] = Field(
-        default_factory=list,
+    temporal_variants: Tuple[TemporalGeography, ...] = Field(
+        default_factory=tuple,
         description="How this geography's name, ruling entity, or boundaries changed over time",
     )
     
@@ -131,8 +131,8 @@ class Geography(BaseEntity):
     geology: Optional[str] = Field(None, description="Geological information")
     
     # Multi-source tracking
-    sources: List[SourceAttribution] = Field(
-        default_factory=list, description="Which sources contributed data"
+    sources: Tuple[SourceAttribution, ...] = Field(
+        default_factory=tuple, description="Which sources contributed data"
     )
     source_of_truth: Optional[str] = Field(None, description="Primary source when conflicts exist")
     confidence: float = Field(
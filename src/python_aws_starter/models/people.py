@@ -1,11 +1,11 @@
 """Models for people and figures in history."""
 
-from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Sequence, Tuple
 from pydantic import BaseModel, Field, ConfigDict
 from .base import BaseEntity
 from .sources import SourceAttribution
-from .claims_utils import Property, extract_time_from_claim, extract_entity_id_from_claim
+from .claims_utils import Property, extract_time_from_claim, is_iso_date
+from .property_synonyms import START_DATE_PROPERTY_ORDER, END_DATE_PROPERTY_ORDER
 
 
 class PersonReference(BaseModel):
@@ -15,6 +15,8 @@ class PersonReference(BaseModel):
     name: str = Field(..., description="Person's name")
     relationship: Optional[str] = Field(None, description="Type of relationship")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class OrganizationReference(BaseModel):
     """Reference to an organization a person is/was part of."""
@@ -25,6 +27,8 @@ class OrganizationReference(BaseModel):
     start_date: Optional[str] = Field(None, description="When they joined")
     end_date: Optional[str] = Field(None, description="When they left")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class Person(BaseEntity):
     """Represents a historical figure or person.
@@ -40,11 +44,11 @@ class Person(BaseEntity):
     death_location: Optional[str] = Field(None, description="Where they died - computed from claims if available")
     
     description: str = Field(..., description="Biography or description - computed from claims if available")
-    occupations: List[str] = Field(
-        default_factory=list, description="Professions or roles - computed from claims if available"
+    occupations: Tuple[str, ...] = Field(
+        default_factory=tuple, description="Professions or roles - computed from claims if available"
     )
-    nationalities: List[str] = Field(
-        default_factory=list, description="Nationalities or ethnic groups - computed from claims if available"
+    nationalities: Tuple[str, ...] = Field(
+        default_factory=tuple, description="Nationalities or ethnic groups - computed from claims if available"
     )
     
     def get_computed_name(self) -> str:
@@ -54,27 +58,23 @@ class Person(BaseEntity):
     
     def get_computed_birth_date(self) -> Optional[str]:
         """Get birth date from claims using property synonyms configuration."""
-        from python_aws_starter.models.property_synonyms import get_start_date_properties
-        
         # Try all start date synonyms (including P569 for birth date)
-        for prop_id in get_start_date_properties():
+        for prop_id in START_DATE_PROPERTY_ORDER:
             claim = self.get_best_claim(prop_id)
             if claim:
                 date_str = extract_time_from_claim(claim)
-                if date_str:
+                if is_iso_date(date_str):
                     return date_str
         return self.birth_date
     
     def get_computed_death_date(self) -> Optional[str]:
         """Get death date from claims using property synonyms configuration."""
-        from python_aws_starter.models.property_synonyms import get_end_date_properties
-        
         # Try all end date synonyms (including P570 for death date)
-        for prop_id in get_end_date_properties():
+        for prop_id in END_DATE_PROPERTY_ORDER:
             claim = self.get_best_claim(prop_id)
             if claim:
                 date_str = extract_time_from_claim(claim)
-                if date_str:
+                if is_iso_date(date_str):
                     return date_str
         return self.death_date
     
@@ -83,28 +83,28 @@ class Person(BaseEntity):
         desc = self.get_description()
         return desc if desc else self.description
     
-    def get_occupations_from_claims(self) -> List[str]:
+    def get_occupations_from_claims(self) -> Sequence[str]:
         """Get occupations from claims (P106)."""
         occupation_claims = self.get_claims(Property.OCCUPATION)
         # This would need entity resolution - simplified for now
         return self.occupations  # TODO: Implement full entity resolution
     
-    def get_nationalities_from_claims(self) -> List[str]:
+    def get_nationalities_from_claims(self) -> Sequence[str]:
         """Get nationalities from claims (P27)."""
         nationality_claims = self.get_claims(Property.COUNTRY_OF_CITIZENSHIP)
         # This would need entity resolution - simplified for now
         return self.nationalities  # TODO: Implement full entity resolution
-    
-    related_people: List[PersonReference] = Field(
-        default_factory=list, description="Related people"
+
+    related_people: Tuple[PersonReference, ...] = Field(
+        default_factory=tuple, description="Related people"
     )
-    organizations: List[OrganizationReference] = Field(
-        default_factory=list, description="Organizations they were part of"
+    organizations: Tuple[OrganizationReference, ...] = Field(
+        default_factory=tuple, description="Organizations they were part of"
     )
     
     # Multi-source tracking
-    sources: List[SourceAttribution] = Field(
-        default_factory=list, description="Which sources contributed data"
+    sources: Tuple[SourceAttribution, ...] = Field(
+        default_factory=tuple, description="Which sources contributed data"
     )
     source_of_truth: Optional[str] = Field(None, description="Primary source when conflicts exist")
     confidence: float = Field(
@@ -7,13 +7,16 @@ to recognize multiple Wikidata properties as equivalent for timeline operations.
 Property definitions can be found at: https://www.wikidata.org/wiki/Property:{Pnumber}
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, FrozenSet, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class PropertySynonym:
     """Represents a property ID and its description."""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10
+    __slots__ = ("property_id", "description", "url")
+    
     property_id: str
     description: str
     url: str
@@ -98,21 +101,25 @@ END_DATE_PROPERTIES: List[PropertySynonym] = [
 ]
 
 # Combined sets for easy lookup
-START_DATE_PROPERTY_IDS: Set[str] = {prop.property_id for prop in START_DATE_PROPERTIES}
-END_DATE_PROPERTY_IDS: Set[str] = {prop.property_id for prop in END_DATE_PROPERTIES}
+START_DATE_PROPERTY_IDS: FrozenSet[str] = frozenset(prop.property_id for prop in START_DATE_PROPERTIES)
+END_DATE_PROPERTY_IDS: FrozenSet[str] = frozenset(prop.property_id for prop in END_DATE_PROPERTIES)
+
+# Priority order (declaration order) used when picking a date from the synonyms
+START_DATE_PROPERTY_ORDER: Tuple[str, ...] = tuple(prop.property_id for prop in START_DATE_PROPERTIES)
+END_DATE_PROPERTY_ORDER: Tuple[str, ...] = tuple(prop.property_id for prop in END_DATE_PROPERTIES)
 
 # All date-related properties (for general date extraction)
-ALL_DATE_PROPERTY_IDS: Set[str] = START_DATE_PROPERTY_IDS | END_DATE_PROPERTY_IDS
+ALL_DATE_PROPERTY_IDS: FrozenSet[str] = START_DATE_PROPERTY_IDS | END_DATE_PROPERTY_IDS
 
 
-def get_start_date_properties() -> List[str]:
-    """Get list of property IDs that represent start dates."""
-    return list(START_DATE_PROPERTY_IDS)
+def get_start_date_properties() -> Tuple[str, ...]:
+    """Get the property IDs that represent start dates, in priority order (shared, immutable)."""
+    return START_DATE_PROPERTY_ORDER
 
 
-def get_end_date_properties() -> List[str]:
-    """Get list of property IDs that represent end dates."""
-    return list(END_DATE_PROPERTY_IDS)
+def get_end_date_properties() -> Tuple[str, ...]:
+    """Get the property IDs that represent end dates, in priority order (shared, immutable)."""
+    return END_DATE_PROPERTY_ORDER
 
 
 def is_start_date_property(property_id: str) -> bool:
@@ -130,27 +137,25 @@ def is_date_property(property_id: str) -> bool:
     return property_id in ALL_DATE_PROPERTY_IDS
 
 
+# property_id -> info dict, built once; start-date entries win if a property is listed twice
+PROPERTY_INFO_INDEX: Dict[str, Dict[str, str]] = {}
+for _props, _type in ((START_DATE_PROPERTIES, "start_date"), (END_DATE_PROPERTIES, "end_date")):
+    for _prop in _props:
+        PROPERTY_INFO_INDEX.setdefault(_prop.property_id, {
+            "property_id": _prop.property_id,
+            "description": _prop.description,
+            "url": _prop.url,
+            "type": _type,
+        })
+del _props, _type, _prop
+
+
 def get_property_info(property_id: str) -> Dict[str, str]:
     """Get information about a property ID."""
-    # Check start date properties
-    for prop in START_DATE_PROPERTIES:
-        if prop.property_id == property_id:
-            return {
-                "property_id": prop.property_id,
-                "description": prop.description,
-                "url": prop.url,
-                "type": "start_date"
-            }
-    
-    # Check end date properties
-    for prop in END_DATE_PROPERTIES:
-        if prop.property_id == property_id:
-            return {
-                "property_id": prop.property_id,
-                "description": prop.description,
-                "url": prop.url,
-                "type": "end_date"
-            }
+    info = PROPERTY_INFO_INDEX.get(property_id)
+    if info is not None:
+        # Copy so callers can't edit the shared index
+        return dict(info)
     
     return {
         "property_id": property_id,
@@ -0,0 +1,15 @@
+"""Reference models shared by several entity modules."""
+
+from typing import Optional
+from pydantic import BaseModel, Field, ConfigDict
+
+
+class GeographicReference(BaseModel):
+    """Simple reference to a geographic location (e.g. where an event took place)."""
+
+    geography_id: str = Field(..., description="Reference to Geography.id")
+    name: str = Field(..., description="Geographic name")
+    latitude: Optional[float] = Field(None, description="Latitude coordinate")
+    longitude: Optional[float] = Field(None, description="Longitude coordinate")
+
+    model_config = ConfigDict(frozen=True)
@@ -4,12 +4,31 @@ This module implements the Wikidata data model structure:
 - Claims/Statements: property-value pairs with qualifiers and references
 - Snaks: property-value pairs (the core building block)
 - Datavalues: typed values (time, quantity, string, entity, etc.)
+
+All models are frozen (``META_MODEL_CONFIG``): there is one instance per
+Wikidata statement, so identical values can be shared safely between claims.
+Property IDs, ranks and statement types are interned on validation so the
+few distinct strings are shared across every parsed entity.
 """
 
-from datetime import datetime, timezone
-from typing import List, Optional, Dict, Any, Union
+import sys
+from typing import List, Optional, Dict, Any, Sequence, Type, Union
 from enum import Enum
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import AfterValidator, BaseModel, Discriminator, Field, ConfigDict, Tag, ValidationError, model_validator
+from typing_extensions import Annotated
+
+# Shared URIs, interned so every claim references the same string object
+GREGORIAN_CALENDAR_URI = sys.intern("http://www.wikidata.org/entity/Q1985727")
+EARTH_GLOBE_URI = sys.intern("http://www.wikidata.org/entity/Q2")
+
+# Shared by every model in this module. Instances are immutable, nested model
+# instances are kept by reference (never revalidated) and unknown Wikidata
+# keys are dropped. Trusted data still goes through validation: with pydantic
+# v2, model_construct is slower than validating (see ADR 001).
+META_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", revalidate_instances="never")
+
+# Short, highly repetitive strings (e.g. 'P569', 'normal') interned at parse time
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
 
 
 class SnakType(str, Enum):
@@ -42,7 +61,9 @@ class TimeValue(BaseModel):
     before: int = Field(default=0, description="Before this many units")
     after: int = Field(default=0, description="After this many units")
     precision: int = Field(..., description="Precision: 9=year, 10=month, 11=day, etc.")
-    calendarmodel: str = Field(default="http://www.wikidata.org/entity/Q1985727", description="Calendar model URI")
+    calendarmodel: str = Field(default=GREGORIAN_CALENDAR_URI, description="Calendar model URI")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class QuantityValue(BaseModel):
@@ -52,6 +73,8 @@ class QuantityValue(BaseModel):
     unit: str = Field(default="1", description="Unit URI (1 = dimensionless)")
     upperBound: Optional[str] = Field(None, description="Upper bound")
     lowerBound: Optional[str] = Field(None, description="Lower bound")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class GlobeCoordinate(BaseModel):
@@ -60,7 +83,9 @@ class GlobeCoordinate(BaseModel):
     latitude: float = Field(..., ge=-90, le=90)
     longitude: float = Field(..., ge=-180, le=180)
     precision: Optional[float] = Field(None, description="Precision in degrees")
-    globe: str = Field(default="http://www.wikidata.org/entity/Q2", description="Globe URI (Q2 = Earth)")
+    globe: str = Field(default=EARTH_GLOBE_URI, description="Globe URI (Q2 = Earth)")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class MonolingualText(BaseModel):
@@ -68,6 +93,8 @@ class MonolingualText(BaseModel):
     
     text: str = Field(..., description="The text")
     language: str = Field(..., description="Language code (e.g., 'en')")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class WikibaseEntityId(BaseModel):
@@ -75,23 +102,70 @@ class WikibaseEntityId(BaseModel):
     
     id: str = Field(..., description="Entity ID (e.g., 'Q123', 'P456')")
     entity_type: str = Field(default="item", description="Type: 'item' or 'property'")
+    
+    model_config = META_MODEL_CONFIG
+
+
+# Value model for each structured Datavalue.type; the other types (string,
+# url, external-id, commonsMedia) carry a plain string
+_VALUE_CLASS_BY_TYPE: Dict[Any, Type[BaseModel]] = {
+    key: value_cls
+    for value_type, value_cls in (
+        (DatavalueType.TIME, TimeValue),
+        (DatavalueType.QUANTITY, QuantityValue),
+        (DatavalueType.GLOBE_COORDINATE, GlobeCoordinate),
+        (DatavalueType.MONOLINGUAL_TEXT, MonolingualText),
+        (DatavalueType.WIKIBASE_ENTITY, WikibaseEntityId),
+    )
+    # Enum members hash by name, so key both the member and its string value
+    for key in (value_type, value_type.value)
+}
+_VALUE_TAG_BY_CLASS: Dict[type, str] = {
+    value_cls: value_type.value for value_type, value_cls in _VALUE_CLASS_BY_TYPE.items() if isinstance(value_type, DatavalueType)
+}
+
+
+def _datavalue_value_tag(value: Any) -> str:
+    """Union tag for ``Datavalue.value`` once ``_build_value`` has dispatched on ``type``."""
+    if isinstance(value, str):
+        return "string"
+    return _VALUE_TAG_BY_CLASS.get(type(value), "dict")
 
 
 class Datavalue(BaseModel):
     """Wikidata datavalue - a typed value."""
     
     type: DatavalueType = Field(..., description="Type of the value")
-    value: Union[
-        TimeValue,
-        QuantityValue,
-        GlobeCoordinate,
-        MonolingualText,
-        WikibaseEntityId,
-        str,
-        Dict[str, Any]
+    value: Annotated[
+        Union[
+            Annotated[TimeValue, Tag("time")],
+            Annotated[QuantityValue, Tag("quantity")],
+            Annotated[GlobeCoordinate, Tag("globecoordinate")],
+            Annotated[MonolingualText, Tag("monolingualtext")],
+            Annotated[WikibaseEntityId, Tag("wikibase-entityid")],
+            Annotated[str, Tag("string")],
+            Annotated[Dict[str, Any], Tag("dict")],
+        ],
+        Discriminator(_datavalue_value_tag),
     ] = Field(..., description="The actual value (type depends on type field)")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _build_value(cls, data: Any) -> Any:
+        """Build the value model picked by ``type``; a value that doesn't fit it stays a plain dict."""
+        if type(data) is dict:
+            value = data.get("value")
+            if type(value) is dict:
+                value_cls = _VALUE_CLASS_BY_TYPE.get(data.get("type"))
+                if value_cls is not None:
+                    try:
+                        return {**data, "value": value_cls.model_validate(value)}
+                    except ValidationError:
+                        pass
+        return data
     
     model_config = ConfigDict(
+        **META_MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "type": "time",
@@ -109,11 +183,12 @@ class Snak(BaseModel):
     """Wikidata snak - a property-value pair."""
     
     snaktype: SnakType = Field(..., description="Type of snak")
-    property: str = Field(..., description="Property ID (e.g., 'P569' for date of birth)")
+    property: InternedStr = Field(..., description="Property ID (e.g., 'P569' for date of birth)")
     datavalue: Optional[Datavalue] = Field(None, description="The value (if snaktype is 'value')")
     datatype: Optional[str] = Field(None, description="Data type of the property")
     
     model_config = ConfigDict(
+        **META_MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "snaktype": "value",
@@ -133,18 +208,22 @@ class Snak(BaseModel):
 class Reference(BaseModel):
     """Wikidata reference - source citation for a statement."""
     
-    snaks: Dict[str, List[Snak]] = Field(default_factory=dict, description="Property-snak mapping")
-    snaks_order: List[str] = Field(default_factory=list, description="Order of properties")
+    snaks: Dict[InternedStr, List[Snak]] = Field(default_factory=dict, description="Property-snak mapping")
+    snaks_order: List[InternedStr] = Field(default_factory=list, description="Order of properties")
     hash: Optional[str] = Field(None, description="Reference hash")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class Qualifier(BaseModel):
     """Wikidata qualifier - additional property-value pair that qualifies a statement."""
     
-    property: str = Field(..., description="Property ID")
+    property: InternedStr = Field(..., description="Property ID")
     snaktype: SnakType = Field(..., description="Type of snak")
     datavalue: Optional[Datavalue] = Field(None, description="The value")
     hash: Optional[str] = Field(None, description="Qualifier hash")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class Claim(BaseModel):
@@ -152,13 +231,14 @@ class Claim(BaseModel):
     
     id: Optional[str] = Field(None, description="Claim ID (guid)")
     mainsnak: Snak = Field(..., description="Main property-value pair")
-    type: str = Field(default="statement", description="Type: 'statement', 'claim', etc.")
-    rank: str = Field(default="normal", description="Rank: 'preferred', 'normal', 'deprecated'")
-    qualifiers: Optional[Dict[str, List[Qualifier]]] = Field(None, description="Qualifiers by property")
-    qualifiers_order: Optional[List[str]] = Field(None, description="Order of qualifier properties")
+    type: InternedStr = Field(default="statement", description="Type: 'statement', 'claim', etc.")
+    rank: InternedStr = Field(default="normal", description="Rank: 'preferred', 'normal', 'deprecated'")
+    qualifiers: Optional[Dict[InternedStr, List[Qualifier]]] = Field(None, description="Qualifiers by property")
+    qualifiers_order: Optional[List[InternedStr]] = Field(None, description="Order of qualifier properties")
     references: Optional[List[Reference]] = Field(None, description="References/sources")
     
     model_config = ConfigDict(
+        **META_MODEL_CONFIG,
         json_schema_extra={
             "example": {
                 "mainsnak": {
@@ -179,16 +259,32 @@ class Claim(BaseModel):
     )
 
 
+def best_claim(claims: Sequence[Claim]) -> Optional[Claim]:
+    """Pick the best claim of a property: the first preferred, else the first normal, else the first."""
+    if not claims:
+        return None
+    first_normal = None
+    for claim in claims:
+        rank = claim.rank
+        if rank == "preferred":
+            return claim
+        if first_normal is None and rank == "normal":
+            first_normal = claim
+    return first_normal or claims[0]
+
+
 class Statement(BaseModel):
     """Wikidata statement - a claim with its ID (alias for Claim with ID)."""
     
     id: str = Field(..., description="Statement ID (guid)")
     mainsnak: Snak = Field(..., description="Main property-value pair")
-    type: str = Field(default="statement", description="Type")
-    rank: str = Field(default="normal", description="Rank")
-    qualifiers: Optional[Dict[str, List[Qualifier]]] = Field(None, description="Qualifiers")
-    qualifiers_order: Optional[List[str]] = Field(None, description="Qualifier order")
+    type: InternedStr = Field(default="statement", description="Type")
+    rank: InternedStr = Field(default="normal", description="Rank")
+    qualifiers: Optional[Dict[InternedStr, List[Qualifier]]] = Field(None, description="Qualifiers")
+    qualifiers_order: Optional[List[InternedStr]] = Field(None, description="Qualifier order")
     references: Optional[List[Reference]] = Field(None, description="References")
+    
+    model_config = META_MODEL_CONFIG
 
 
 class EntityLabels(BaseModel):
@@ -198,6 +294,8 @@ class EntityLabels(BaseModel):
         default_factory=dict,
         description="Language code -> {language, value}"
     )
+    
+    model_config = META_MODEL_CONFIG
 
 
 class EntityDescriptions(BaseModel):
@@ -207,6 +305,8 @@ class EntityDescriptions(BaseModel):
         default_factory=dict,
         description="Language code -> {language, value}"
     )
+    
+    model_config = META_MODEL_CONFIG
 
 
 class EntityAliases(BaseModel):
@@ -216,6 +316,8 @@ class EntityAliases(BaseModel):
         default_factory=dict,
         description="Language code -> list of {language, value}"
     )
+    
+    model_config = META_MODEL_CONFIG
 
 
 class WikibaseEntity(BaseModel):
@@ -235,7 +337,7 @@ class WikibaseEntity(BaseModel):
         default_factory=dict,
         description="Aliases by language code"
     )
-    claims: Dict[str, List[Claim]] = Field(
+    claims: Dict[InternedStr, List[Claim]] = Field(
         default_factory=dict,
         description="Claims by property ID"
     )
@@ -246,6 +348,8 @@ class WikibaseEntity(BaseModel):
     lastrevid: Optional[int] = Field(None, description="Last revision ID")
     modified: Optional[str] = Field(None, description="Last modified timestamp")
     
+    model_config = META_MODEL_CONFIG
+    
     def get_label(self, lang: str = "en") -> str:
         """Get label in specified language."""
         label_data = self.labels.get(lang, {})
@@ -262,19 +366,4 @@ class WikibaseEntity(BaseModel):
     
     def get_best_claim(self, property_id: str) -> Optional[Claim]:
         """Get the best (preferred or first normal) claim for a property."""
-        claims = self.get_claims(property_id)
-        if not claims:
-            return None
-        
-        # Prefer preferred rank
-        for claim in claims:
-            if claim.rank == "preferred":
-                return claim
-        
-        # Fall back to first normal rank
-        for claim in claims:
-            if claim.rank == "normal":
-                return claim
-        
-        # Last resort: return first claim
-        return claims[0] if claims else None
+        return best_claim(self.claims.get(property_id, ()))
@@ -1,18 +1,186 @@
 """Simple in-memory repository to support pivot demos and tests."""
-from typing import List, Optional, Dict, Any, Tuple
+from collections import OrderedDict, defaultdict
+from types import MappingProxyType
+from typing import Iterable, Iterator, List, Mapping, Optional, Dict, Any, Sequence, Set, Tuple, Union
 from datetime import datetime
-import math
+import threading
+
+import numpy as np
 
 from python_aws_starter.models.events import Event
 from python_aws_starter.models.people import Person
 from python_aws_starter.models.geography import Geography
+from python_aws_starter.models.wikidata_meta import Claim
+from python_aws_starter.models.claims_utils import (
+    extract_time_from_claim,
+    extract_entity_id_from_claim,
+    extract_string_from_claim,
+)
+from python_aws_starter.utils.geo import LatBandIndex, haversine_km
+
+Entity = Union[Person, Event, Geography]
+
+# Entity type names accepted by search_by_property, in result order
+ENTITY_TYPES = ("person", "event", "geography")
+
+# Recent text searches kept for prefix narrowing in search_events
+SEARCH_CACHE_SIZE = 64
+
+
+def _claim_index_value(claim: Claim) -> Optional[str]:
+    """Value of a claim as matched by ``search_by_property(value=...)``.
+
+    Time claims match on their ISO date, entity claims on the target id and
+    string claims on the string itself; other datatypes are not value-indexed.
+    """
+    return (
+        extract_time_from_claim(claim)
+        or extract_entity_id_from_claim(claim)
+        or extract_string_from_claim(claim)
+    )
 
 
 class InMemoryRepository:
+    """Read-only repository over lists loaded at startup.
+
+    The entity stores are exposed as ``MappingProxyType`` views, so one
+    instance can be shared across request threads without copying.
+    """
+
+    __slots__ = (
+        "events",
+        "people",
+        "geographies",
+        "entities_by_id",
+        "_events_list",
+        "_people_list",
+        "_geographies_list",
+        "_event_haystacks",
+        "_person_haystacks",
+        "_geo_haystacks",
+        "_event_dates",
+        "_pivot",
+        "_geo_ids",
+        "_geo_index",
+        "_event_loc_events",
+        "_event_loc_index",
+        "_stores",
+        "_load_order",
+        "by_property",
+        "by_property_value",
+        "_search_cache",
+        "_search_cache_lock",
+    )
+
     def __init__(self, events: List[Event], people: List[Person], geographies: List[Geography]):
-        self.events = {e.id: e for e in events}
-        self.people = {p.id: p for p in people}
-        self.geographies = {g.id: g for g in geographies}
+        # (lowered text, other filters) -> matching events, most recent last
+        self._search_cache: "OrderedDict[Tuple[Any, ...], Tuple[Event, ...]]" = OrderedDict()
+        self._search_cache_lock = threading.Lock()
+        self.events: Mapping[str, Event] = MappingProxyType({e.id: e for e in events})
+        self.people: Mapping[str, Person] = MappingProxyType({p.id: p for p in people})
+        self.geographies: Mapping[str, Geography] = MappingProxyType({g.id: g for g in geographies})
+        # Union index for id-only lookups; on id collisions people win, then events
+        self.entities_by_id: Mapping[str, Entity] = MappingProxyType(
+            {**self.geographies, **self.events, **self.people}
+        )
+        # The stores never change, so list_* can hand out one shared tuple each
+        self._events_list: Tuple[Event, ...] = tuple(self.events.values())
+        self._people_list: Tuple[Person, ...] = tuple(self.people.values())
+        self._geographies_list: Tuple[Geography, ...] = tuple(self.geographies.values())
+
+        # Pre-lowered searchable text per event (title, description, related people names),
+        # fields joined by NUL so a query can't match across a field boundary
+        self._event_haystacks: Dict[str, str] = {
+            e.id: "\0".join(
+                [e.title or "", e.description or ""]
+                + [rp.name for rp in e.related_people if rp.name]
+            ).lower()
+            for e in self.events.values()
+        }
+        # Same for people (name, description, occupations) and geographies (name, description)
+        self._person_haystacks: Dict[str, str] = {
+            p.id: "\0".join([p.name or "", p.description or "", *p.occupations]).lower()
+            for p in self.people.values()
+        }
+        self._geo_haystacks: Dict[str, str] = {
+            g.id: "\0".join([g.name or "", g.description or ""]).lower()
+            for g in self.geographies.values()
+        }
+
+        # Parsed (start, end) per event for date-range filters; end falls back to start
+        self._event_dates: Dict[str, Tuple[Optional[datetime], Optional[datetime]]] = {}
+        for e in self.events.values():
+            ev_start = self._parse_date(e.start_date.start_date)
+            ev_end = self._parse_date(e.end_date.start_date) if e.end_date else None
+            self._event_dates[e.id] = (ev_start, ev_end or ev_start)
+
+        # Adjacency lists for pivot(), built with one walk over the events
+        people_to_events: Dict[str, List[Event]] = defaultdict(list)
+        events_to_people: Dict[str, List[Person]] = {}
+        geographies_to_events: Dict[str, List[Event]] = defaultdict(list)
+        events_to_geographies: Dict[str, List[Geography]] = {}
+        for e in self.events.values():
+            for pid in dict.fromkeys(rp.person_id for rp in e.related_people):
+                people_to_events[pid].append(e)
+            for gid in dict.fromkeys(loc.geography_id for loc in e.locations):
+                geographies_to_events[gid].append(e)
+            events_to_people[e.id] = [self.people[rp.person_id] for rp in e.related_people if rp.person_id in self.people]
+            events_to_geographies[e.id] = [
+                self.geographies[loc.geography_id] for loc in e.locations if loc.geography_id in self.geographies
+            ]
+        self._pivot: Dict[Tuple[str, str], Dict[str, List[Any]]] = {
+            ("people", "events"): dict(people_to_events),
+            ("events", "people"): events_to_people,
+            ("geographies", "events"): dict(geographies_to_events),
+            ("events", "geographies"): events_to_geographies,
+        }
+
+        # Geography centers and event locations indexed for vectorized proximity search
+        located = [
+            (g.id, g.center_coordinate) for g in self.geographies.values()
+            if g.center_coordinate is not None
+        ]
+        self._geo_ids: List[str] = [gid for gid, _ in located]
+        self._geo_index = LatBandIndex(
+            np.fromiter((c.latitude for _, c in located), dtype=np.float64, count=len(located)),
+            np.fromiter((c.longitude for _, c in located), dtype=np.float64, count=len(located)),
+        )
+        # One row per located event location; row -> event id
+        event_locs = [
+            (e.id, loc.latitude, loc.longitude)
+            for e in self.events.values()
+            for loc in e.locations
+            if loc.latitude is not None and loc.longitude is not None
+        ]
+        self._event_loc_events: List[str] = [eid for eid, _, _ in event_locs]
+        self._event_loc_index = LatBandIndex(
+            np.array([lat for _, lat, _ in event_locs], dtype=np.float64),
+            np.array([lon for _, _, lon in event_locs], dtype=np.float64),
+        )
+
+        # Inverted indexes for property lookups, built once at load time
+        self._stores: Dict[str, Mapping[str, Entity]] = {
+            "person": self.people,
+            "event": self.events,
+            "geography": self.geographies,
+        }
+        # Index entries are (entity type, id): the same id may exist in more than one store
+        # Per-type insertion position, to return index hits in repository order
+        self._load_order: Dict[Tuple[str, str], int] = {}
+        self.by_property: Dict[str, Set[Tuple[str, str]]] = defaultdict(set)
+        self.by_property_value: Dict[Tuple[str, str], Set[Tuple[str, str]]] = defaultdict(set)
+        for type_name, store in self._stores.items():
+            for i, entity in enumerate(store.values()):
+                key = (type_name, entity.id)
+                self._load_order[key] = i
+                for pid, claims in entity.claims.items():
+                    if not claims:
+                        continue
+                    self.by_property[pid].add(key)
+                    for claim in claims:
+                        value = _claim_index_value(claim)
+                        if value is not None:
+                            self.by_property_value[(pid, value)].add(key)
 
     # Basic getters
     def get_event_by_id(self, event_id: str) -> Optional[Event]:
@@ -24,20 +192,55 @@ class InMemoryRepository:
     def get_geo_by_id(self, geo_id: str) -> Optional[Geography]:
         return self.geographies.get(geo_id)
 
+    def get_entity_by_id(self, entity_id: str) -> Optional[Entity]:
+        return self.entities_by_id.get(entity_id)
+
     # List operations
-    def list_events(self) -> List[Event]:
-        return list(self.events.values())
+    def list_events(self) -> Tuple[Event, ...]:
+        return self._events_list
 
-    def list_people(self) -> List[Person]:
-        return list(self.people.values())
+    def list_people(self) -> Tuple[Person, ...]:
+        return self._people_list
 
-    def list_geographies(self) -> List[Geography]:
-        return list(self.geographies.values())
+    def list_geographies(self) -> Tuple[Geography, ...]:
+        return self._geographies_list
 
-    # Search / filter capabilities
-    def _text_match(self, haystack: str, query: str) -> bool:
-        return query.lower() in (haystack or "").lower()
+    def iter_events(self) -> Iterable[Event]:
+        return self.events.values()
+
+    def iter_people(self) -> Iterable[Person]:
+        return self.people.values()
+
+    def iter_geographies(self) -> Iterable[Geography]:
+        return self.geographies.values()
+
+    def search_by_property(
+        self, property_id: str, value: Optional[str] = None, entity_type: Optional[str] = None
+    ) -> List[Entity]:
+        """Entities having a claim for `property_id`, optionally with a given value.
+
+        - `value`: matched against the claim's ISO date, entity id or string value (ignored when empty)
+        - `entity_type`: restrict to 'person', 'event' or 'geography'
+
+        Results are grouped people, events, geographies, in repository order.
+        """
+        if value:
+            keys = self.by_property_value.get((property_id, value), set())
+        else:
+            keys = self.by_property.get(property_id, set())
+        if not keys:
+            return []
+
+        results: List[Entity] = []
+        for type_name in ENTITY_TYPES:
+            if entity_type and entity_type != type_name:
+                continue
+            matched = sorted((key for key in keys if key[0] == type_name), key=self._load_order.__getitem__)
+            store = self._stores[type_name]
+            results.extend(store[entity_id] for _, entity_id in matched)
+        return results
 
+    # Search / filter capabilities
     def _parse_date(self, d: Optional[str]) -> Optional[datetime]:
         if not d:
             return None
@@ -51,14 +254,15 @@ class InMemoryRepository:
 
     def _haversine_km(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         # Returns distance in kilometers between two coords
-        R = 6371.0
-        phi1 = math.radians(lat1)
-        phi2 = math.radians(lat2)
-        dphi = math.radians(lat2 - lat1)
-        dlambda = math.radians(lon2 - lon1)
-        a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return R * c
+        return haversine_km(lat1, lon1, lat2, lon2)
+
+    def _geos_within(self, lat: float, lon: float, km: float) -> List[str]:
+        """Ids of geographies whose center is within `km` of (lat, lon), in repository order."""
+        return [self._geo_ids[i] for i in self._geo_index.within(lat, lon, km)]
+
+    def _events_within(self, lat: float, lon: float, km: float) -> Set[str]:
+        """Ids of events with at least one location within `km` of (lat, lon)."""
+        return {self._event_loc_events[i] for i in self._event_loc_index.within(lat, lon, km)}
 
     def search_events(
         self,
@@ -80,41 +284,37 @@ class InMemoryRepository:
         s_dt = self._parse_date(start_date)
         e_dt = self._parse_date(end_date)
 
-        for ev in self.events.values():
+        text_lower = text.lower() if text else None
+        haystacks = self._event_haystacks
+        event_dates = self._event_dates
+        near_events: Optional[Set[str]] = None
+        if center_coord and within_km is not None:
+            near_events = self._events_within(center_coord[0], center_coord[1], within_km)
+
+        # geography id filter: start from the geography -> events index
+        candidates: Sequence[Event] = (
+            self._pivot[("geographies", "events")].get(geography_id, ()) if geography_id else self._events_list
+        )
+
+        # Typing narrows results: a query extending a recent one (same other
+        # filters) only needs to recheck that query's matches
+        filters = (start_date, end_date, geography_id, tuple(center_coord) if center_coord else None, within_km)
+        if text_lower:
+            cached = self._cached_search(text_lower, filters)
+            if cached is not None:
+                prefix, matches = cached
+                if prefix == text_lower:
+                    return list(matches)
+                candidates = matches
+
+        for ev in candidates:
             # text filter
-            if text:
-                text_lower = text.lower()
-                matched = False
-                if ev.title and self._text_match(ev.title, text_lower):
-                    matched = True
-                if not matched and ev.description and self._text_match(ev.description, text_lower):
-                    matched = True
-                if not matched:
-                    for rp in getattr(ev, "related_people", []):
-                        if getattr(rp, "name", None) and self._text_match(rp.name, text_lower):
-                            matched = True
-                            break
-                if not matched:
-                    continue
-
-            # geography id filter
-            if geography_id:
-                found_geo = False
-                for loc in getattr(ev, "locations", []):
-                    if getattr(loc, "geography_id", None) == geography_id:
-                        found_geo = True
-                        break
-                if not found_geo:
-                    continue
+            if text_lower and text_lower not in haystacks[ev.id]:
+                continue
 
             # date range overlap filter
             if s_dt or e_dt:
-                ev_start = self._parse_date(getattr(ev.start_date, "start_date", None))
-                ev_end = None
-                if getattr(ev, "end_date", None):
-                    ev_end = self._parse_date(getattr(ev.end_date, "start_date", None))
-                if not ev_end:
-                    ev_end = ev_start
+                ev_start, ev_end = event_dates[ev.id]
                 # if parsing failed, skip date filtering
                 if ev_start:
                     if s_dt and ev_end < s_dt:
@@ -123,125 +323,97 @@ class InMemoryRepository:
                         continue
 
             # proximity filter
-            if center_coord and within_km is not None:
-                latc, lonc = center_coord
-                close = False
-                for loc in getattr(ev, "locations", []):
-                    lat = getattr(loc, "latitude", None)
-                    lon = getattr(loc, "longitude", None)
-                    if lat is None or lon is None:
-                        continue
-                    dist = self._haversine_km(latc, lonc, lat, lon)
-                    if dist <= within_km:
-                        close = True
-                        break
-                if not close:
-                    continue
+            if near_events is not None and ev.id not in near_events:
+                continue
 
             results.append(ev)
 
+        if text_lower:
+            self._cache_search(text_lower, filters, results)
         return results
 
+    def _cached_search(
+        self, text_lower: str, filters: Tuple[Any, ...]
+    ) -> Optional[Tuple[str, Tuple[Event, ...]]]:
+        """Longest cached prefix of `text_lower` with the same filters, and its matches."""
+        with self._search_cache_lock:
+            for end in range(len(text_lower), 0, -1):
+                key = (text_lower[:end],) + filters
+                matches = self._search_cache.get(key)
+                if matches is not None:
+                    self._search_cache.move_to_end(key)
+                    return text_lower[:end], matches
+        return None
+
+    def _cache_search(self, text_lower: str, filters: Tuple[Any, ...], results: List[Event]) -> None:
+        with self._search_cache_lock:
+            self._search_cache[(text_lower,) + filters] = tuple(results)
+            self._search_cache.move_to_end((text_lower,) + filters)
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
     def search_people(self, text: Optional[str] = None, related_event_id: Optional[str] = None) -> List[Person]:
         results: List[Person] = []
+        text_lower = text.lower() if text else None
+        haystacks = self._person_haystacks
         for p in self.people.values():
-            if text:
-                if not (
-                    self._text_match(p.name, text)
-                    or self._text_match(getattr(p, "description", ""), text)
-                    or any(self._text_match(o, text) for o in getattr(p, "occupations", []))
-                ):
-                    continue
+            if text_lower and text_lower not in haystacks[p.id]:
+                continue
 
             if related_event_id:
                 # ensure person appears in event
-                found = False
                 ev = self.get_event_by_id(related_event_id)
-                if ev:
-                    for rp in getattr(ev, "related_people", []):
-                        if rp.person_id == p.id:
-                            found = True
-                            break
-                if not found:
+                if not ev or not any(rp.person_id == p.id for rp in ev.related_people):
                     continue
 
             results.append(p)
         return results
 
     def search_geographies(self, text: Optional[str] = None, center_coord: Optional[Tuple[float, float]] = None, within_km: Optional[float] = None) -> List[Geography]:
+        if center_coord and within_km is not None:
+            latc, lonc = center_coord
+            candidates: Sequence[Geography] = [self.geographies[gid] for gid in self._geos_within(latc, lonc, within_km)]
+        else:
+            candidates = self._geographies_list
+
         results: List[Geography] = []
-        for g in self.geographies.values():
-            if text and not (
-                self._text_match(g.name, text) or self._text_match(getattr(g, "description", ""), text)
-            ):
+        text_lower = text.lower() if text else None
+        haystacks = self._geo_haystacks
+        for g in candidates:
+            if text_lower and text_lower not in haystacks[g.id]:
                 continue
 
-            if center_coord and within_km is not None:
-                latc, lonc = center_coord
-                coord = getattr(g, "center_coordinate", None)
-                if not coord or getattr(coord, "latitude", None) is None or getattr(coord, "longitude", None) is None:
-                    continue
-                dist = self._haversine_km(latc, lonc, coord.latitude, coord.longitude)
-                if dist > within_km:
-                    continue
-
             results.append(g)
 
         return results
 
-    # Pivot helpers
+    # Pivot helpers: lookups in the adjacency lists built in __init__
     def get_events_by_person(self, person_id: str) -> List[Event]:
-        result = []
-        for e in self.events.values():
-            for rp in getattr(e, "related_people", []):
-                if rp.person_id == person_id:
-                    result.append(e)
-                    break
-        return result
+        return self.pivot("people", "events", person_id)
 
     def get_people_by_event(self, event_id: str) -> List[Person]:
-        e = self.get_event_by_id(event_id)
-        if not e:
-            return []
-        result = []
-        for rp in getattr(e, "related_people", []):
-            p = self.get_person_by_id(rp.person_id)
-            if p:
-                result.append(p)
-        return result
+        return self.pivot("events", "people", event_id)
 
     def get_events_by_geo(self, geo_id: str) -> List[Event]:
-        result = []
-        for e in self.events.values():
-            for loc in getattr(e, "locations", []):
-                if loc.geography_id == geo_id:
-                    result.append(e)
-                    break
-        return result
+        return self.pivot("geographies", "events", geo_id)
 
     def get_geos_by_event(self, event_id: str) -> List[Geography]:
-        e = self.get_event_by_id(event_id)
-        if not e:
-            return []
-        result = []
-        for loc in getattr(e, "locations", []):
-            g = self.get_geo_by_id(loc.geography_id)
-            if g:
-                result.append(g)
-        return result
+        return self.pivot("events", "geographies", event_id)
+
+    # Streaming variants: iterate the adjacency list without copying it
+    def iter_events_by_person(self, person_id: str) -> Iterator[Event]:
+        return self.iter_pivot("people", "events", person_id)
+
+    def iter_events_by_geo(self, geo_id: str) -> Iterator[Event]:
+        return self.iter_pivot("geographies", "events", geo_id)
 
     # Generic pivot: from dimension -> to dimension
+    def iter_pivot(self, from_dim: str, to_dim: str, id_value: str) -> Iterator[Any]:
+        """Like :meth:`pivot`, but yields the target entities lazily."""
+        return iter(self._pivot.get((from_dim, to_dim), {}).get(id_value, ()))
+
     def pivot(self, from_dim: str, to_dim: str, id_value: str):
         """Simple pivot dispatcher. from_dim/to_dim in {"events","people","geographies"}.
         Returns list of target entities.
         """
-        mapping = {
-            ("people", "events"): self.get_events_by_person,
-            ("events", "people"): self.get_people_by_event,
-            ("geographies", "events"): self.get_events_by_geo,
-            ("events", "geographies"): self.get_geos_by_event,
-        }
-        fn = mapping.get((from_dim, to_dim))
-        if not fn:
-            return []
-        return fn(id_value)
+        return list(self.iter_pivot(from_dim, to_dim, id_value))
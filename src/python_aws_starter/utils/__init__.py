@@ -1,6 +1,18 @@
 """Utility modules for the timeline application."""
 
+import importlib
+from typing import Any
+
 from . import wikidata
-from . import export_dataset
 
-__all__ = ["wikidata", "export_dataset"]
+__all__ = ["wikidata", "geo", "export_dataset"]
+
+# Imported on first attribute access: export_dataset pulls in the test
+# fixtures, and geo is only needed by proximity searches
+_LAZY_SUBMODULES = frozenset({"geo", "export_dataset"})
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,82 @@
+"""Request-coalescing loader for Wikidata entity lookups.
+
+When the frontend renders a timeline it fires many ``/wikidata/entity/{qid}``
+requests at once. Rather than one HTTP call per QID, :class:`WikidataEntityLoader`
+buffers the QIDs that arrive within a short window and resolves them all with a
+single batched fetch (``wbgetentities`` accepts up to 50 ids per call).
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+BatchFn = Callable[[List[str]], Awaitable[Dict[str, Any]]]
+
+
+class WikidataEntityLoader:
+    """DataLoader-style batcher: ``await loader.load(qid)`` from many coroutines,
+    one ``batch_fn(qids)`` call per window.
+
+    The queue and worker task belong to the running event loop; they are
+    recreated if the loader is used from a different loop (e.g. test clients).
+    """
+
+    def __init__(self, batch_fn: BatchFn, max_batch_size: int = 50, batch_interval_ms: int = 10):
+        self._batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval_ms / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[Tuple[str, asyncio.Future]]"] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def load(self, key: str) -> Optional[Any]:
+        """Resolve a single key, batched with any other keys requested concurrently."""
+        queue = self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((key, future))
+        return await future
+
+    def _ensure_worker(self) -> "asyncio.Queue[Tuple[str, asyncio.Future]]":
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._queue is None or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: "asyncio.Queue[Tuple[str, asyncio.Future]]") -> None:
+        while True:
+            batch = [await queue.get()]
+            # Give the rest of the burst a moment to arrive unless the batch is already full
+            if queue.qsize() < self.max_batch_size - 1:
+                await asyncio.sleep(self.batch_interval)
+            while len(batch) < self.max_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            # Dispatch without blocking the collection of the next batch
+            task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        keys = list(dict.fromkeys(key for key, _ in batch))
+        logger.debug("[entity_loader] dispatching batch of %d keys (%d requests)", len(keys), len(batch))
+        try:
+            results = await self._batch_fn(keys)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        except BaseException:
+            # Cancelled mid-fetch: cancel the waiters too rather than leave load() hanging
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+            raise
+        for key, future in batch:
+            if not future.done():
+                future.set_result(results.get(key))
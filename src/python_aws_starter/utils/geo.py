@@ -0,0 +1,55 @@
+"""Great-circle distance helpers and a latitude-band proximity index."""
+
+import math
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371.0
+# Great-circle km per degree of latitude; a point within d km of a center is
+# within d / KM_PER_DEGREE degrees of its latitude, whatever the longitude
+KM_PER_DEGREE = EARTH_RADIUS_KM * math.pi / 180
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in km between two coordinates."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+
+
+def haversine_km_vec(lat0: float, lon0: float, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Great-circle distances in km from (lat0, lon0) to every (lats[i], lons[i])."""
+    phi1 = np.radians(lat0)
+    phi2 = np.radians(lats)
+    dphi = phi2 - phi1
+    dlambda = np.radians(lons - lon0)
+    a = np.sin(dphi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class LatBandIndex:
+    """Points as parallel lat/lon arrays (SoA) sorted by latitude.
+
+    A proximity query binary-searches the latitude band it can reach and
+    computes distances only there. Any point within km great-circle distance
+    lies inside that band, so the prefilter is exact.
+    """
+
+    __slots__ = ("order", "lat", "lon")
+
+    def __init__(self, lat: np.ndarray, lon: np.ndarray):
+        # Sorted row -> input row
+        self.order = np.argsort(lat, kind="stable")
+        self.lat = lat[self.order]
+        self.lon = lon[self.order]
+
+    def within(self, lat: float, lon: float, km: float) -> np.ndarray:
+        """Input rows within `km` of (lat, lon), ascending."""
+        dlat = km / KM_PER_DEGREE
+        lo = np.searchsorted(self.lat, lat - dlat, side="left")
+        hi = np.searchsorted(self.lat, lat + dlat, side="right")
+        dist = haversine_km_vec(lat, lon, self.lat[lo:hi], self.lon[lo:hi])
+        return np.sort(self.order[lo:hi][dist <= km])
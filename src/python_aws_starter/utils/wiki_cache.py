@@ -0,0 +1,125 @@
+"""In-memory TTL cache for Wikidata search and entity lookups.
+
+Repeated UI queries (typing, going 'back', re-opening a card) hit Wikidata with
+the same search text or QID. Results are kept in a bounded LRU cache with a
+short TTL so those repeats resolve from memory instead of a network round trip.
+
+Empty results are not cached: the Wikidata helpers return ``[]``/``None`` on
+errors as well as on misses, and we don't want to pin a transient failure.
+
+Callers get their own copy of the cached lists and dicts (the raw Wikidata
+JSON), so mutating a result can't corrupt later hits. Models inside a result
+are frozen and shared.
+"""
+
+import asyncio
+import functools
+import threading
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+CACHE_MAXSIZE = 1024
+CACHE_TTL_SECONDS = 120
+
+_cache: TTLCache = TTLCache(maxsize=CACHE_MAXSIZE, ttl=CACHE_TTL_SECONDS)
+# cachetools caches are not thread-safe; sync callers run in the threadpool.
+_cache_lock = threading.Lock()
+
+
+def search_key(query: str, limit: int = 10, *args: Any, **kwargs: Any) -> Tuple[Hashable, ...]:
+    """Cache key for search calls; query text is normalized so 'Paris ' == 'paris'."""
+    return hashkey(query.strip().lower(), limit, *args, **kwargs)
+
+
+def entity_key(qid: str, *args: Any, **kwargs: Any) -> Tuple[Hashable, ...]:
+    """Cache key for entity lookups by QID (already normalized by the caller, e.g. 'Q90')."""
+    return hashkey(qid, *args, **kwargs)
+
+
+def _get(key: Hashable) -> Any:
+    with _cache_lock:
+        return _cache.get(key)
+
+
+def _set(key: Hashable, value: Any) -> None:
+    with _cache_lock:
+        _cache[key] = value
+
+
+def _fresh(value: Any) -> Any:
+    """Caller-owned copy of a cached value: lists and dicts are copied recursively."""
+    if type(value) is dict:
+        return {k: _fresh(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_fresh(v) for v in value]
+    return value
+
+
+def cached(key: Callable[..., Tuple[Hashable, ...]]) -> Callable:
+    """Cache a synchronous Wikidata lookup keyed on ``(function name, *key(...))``."""
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_key = (fn.__name__,) + key(*args, **kwargs)
+            value = _get(cache_key)
+            if value is not None:
+                return _fresh(value)
+            value = fn(*args, **kwargs)
+            if value:
+                _set(cache_key, value)
+                return _fresh(value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def cached_async(key: Callable[..., Tuple[Hashable, ...]]) -> Callable:
+    """Cache an async Wikidata lookup, coalescing concurrent identical calls.
+
+    The first caller for a key starts the fetch as a task; callers asking for
+    the same key while it runs await that task instead of starting their own
+    (single-flight), so a burst of identical queries costs one HTTP request.
+    The task is shielded, so a cancelled caller doesn't cancel the fetch for
+    the others.
+    """
+
+    def decorator(fn: Callable) -> Callable:
+        inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+
+        async def fetch(cache_key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            try:
+                value = await fn(*args, **kwargs)
+                if value:
+                    _set(cache_key, value)
+                return value
+            finally:
+                inflight.pop(cache_key, None)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            cache_key = (fn.__name__,) + key(*args, **kwargs)
+            value = _get(cache_key)
+            if value is not None:
+                return _fresh(value)
+
+            task = inflight.get(cache_key)
+            if task is None:
+                task = inflight[cache_key] = asyncio.ensure_future(fetch(cache_key, args, kwargs))
+            return _fresh(await asyncio.shield(task))
+
+        return wrapper
+
+    return decorator
+
+
+def flush() -> int:
+    """Drop every cached entry; returns the number of entries removed."""
+    with _cache_lock:
+        count = len(_cache)
+        _cache.clear()
+    return count
@@ -6,20 +6,28 @@ which returns lightweight results. Full entity data is fetched via REST API (wbg
 only when needed for linking or detailed views.
 """
 
+import asyncio
 import logging
+import random
+import re
+import threading
 from typing import List, Optional, Dict, Any, Tuple
+import httpx
 import requests
 from datetime import datetime, timezone
 
 from python_aws_starter.config import config
-from python_aws_starter.models.events import Event, DateRange, GeographicReference, PersonReference
+from python_aws_starter.utils import wiki_cache
+from python_aws_starter.utils.entity_loader import WikidataEntityLoader
+from python_aws_starter.models.events import Event, DateRange, GeographicReference
 from python_aws_starter.models.people import Person
 from python_aws_starter.models.geography import Geography, GeographyType, Coordinate
 from python_aws_starter.models.sources import SourceAttribution, SourceType
 from python_aws_starter.models.wikidata_meta import (
     Claim, Snak, Datavalue, DatavalueType, SnakType,
-    TimeValue, GlobeCoordinate, WikibaseEntityId, Qualifier, Reference
+    TimeValue, GlobeCoordinate, WikibaseEntityId, MonolingualText, WikibaseEntity,
 )
+from python_aws_starter.models.property_synonyms import START_DATE_PROPERTY_ORDER, END_DATE_PROPERTY_ORDER
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +37,58 @@ WIKIDATA_SPARQL_URL = "https://query.wikidata.org/sparql"
 # User-Agent header required by Wikidata API
 WIKIDATA_USER_AGENT = "python-aws-starter/0.1.0 (https://github.com/mrjohnskelton/python-aws-starter; contact via GitHub)"
 
+# Entity IDs accepted by wbgetentities; a malformed id fails the whole batch
+_ENTITY_ID_RE = re.compile(r"^[QPL]\d+$")
+
+# Shared async client so keep-alive connections are reused across requests.
+# Created lazily on first use from inside the running event loop (and recreated
+# if called from a different loop, since pooled connections are loop-bound).
+_ASYNC_CLIENT: Optional[httpx.AsyncClient] = None
+_ASYNC_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """Return the module-level async HTTP client, creating it on first use."""
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    loop = asyncio.get_running_loop()
+    if _ASYNC_CLIENT is None or _ASYNC_CLIENT.is_closed or _ASYNC_CLIENT_LOOP is not loop:
+        _ASYNC_CLIENT_LOOP = loop
+        # HTTP/2 multiplexes concurrent search/entity calls over one kept-alive connection
+        _ASYNC_CLIENT = httpx.AsyncClient(
+            headers={"User-Agent": WIKIDATA_USER_AGENT},
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=5.0,
+        )
+    return _ASYNC_CLIENT
+
+
+# Shared sync session for the blocking helpers (run from the threadpool), so
+# repeated calls reuse kept-alive TCP/TLS connections instead of reconnecting.
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the module-level requests session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                session.headers["User-Agent"] = WIKIDATA_USER_AGENT
+                _SESSION = session
+    return _SESSION
+
+
+async def aclose_async_client() -> None:
+    """Close the shared async HTTP client (called on application shutdown)."""
+    global _ASYNC_CLIENT, _ASYNC_CLIENT_LOOP
+    if _ASYNC_CLIENT is not None and _ASYNC_CLIENT_LOOP is asyncio.get_running_loop():
+        await _ASYNC_CLIENT.aclose()
+    _ASYNC_CLIENT = None
+    _ASYNC_CLIENT_LOOP = None
+
 
 def get_random_wikidata_entities(limit: int = 1, instance_of: Optional[str] = None) -> List[str]:
     """Get random Wikidata entity QIDs using SPARQL.
@@ -43,8 +103,6 @@ def get_random_wikidata_entities(limit: int = 1, instance_of: Optional[str] = No
     Returns:
         List of entity QIDs (e.g., ["Q517", "Q123"])
     """
-    import random
-    
     # Build SPARQL query - use a simpler approach that's more reliable
     if instance_of:
         query = f"""
@@ -69,7 +127,7 @@ def get_random_wikidata_entities(limit: int = 1, instance_of: Optional[str] = No
         params = {"query": query, "format": "json"}
         
         logger.debug("[wikidata] SPARQL random query -> url=%s", WIKIDATA_SPARQL_URL)
-        response = requests.get(WIKIDATA_SPARQL_URL, params=params, headers=headers, timeout=15)
+        response = _get_session().get(WIKIDATA_SPARQL_URL, params=params, headers=headers, timeout=15)
         logger.debug("[wikidata] SPARQL response status=%s", response.status_code)
         response.raise_for_status()
         
@@ -91,7 +149,7 @@ def get_random_wikidata_entities(limit: int = 1, instance_of: Optional[str] = No
                 qid = item_uri.split("/entity/")[-1]
                 qids.append(qid)
         
-        logger.info(f"[wikidata] SPARQL returned {len(qids)} random entities from {len(results)} total")
+        logger.info("[wikidata] SPARQL returned %d random entities from %d total", len(qids), len(results))
         return qids
     except Exception as e:
         logger.exception("[wikidata] SPARQL random query error: %s", e)
@@ -105,7 +163,7 @@ def get_random_wikidata_entities(limit: int = 1, instance_of: Optional[str] = No
             if search_results:
                 sampled = random.sample(search_results, min(limit, len(search_results)))
                 qids = [r.get("id", "") for r in sampled if r.get("id", "")]
-                logger.info(f"[wikidata] Fallback search returned {len(qids)} entities")
+                logger.info("[wikidata] Fallback search returned %d entities", len(qids))
                 return qids
         except Exception as fallback_error:
             logger.exception("[wikidata] Fallback search also failed: %s", fallback_error)
@@ -114,15 +172,30 @@ def get_random_wikidata_entities(limit: int = 1, instance_of: Optional[str] = No
 
 def _log_body(body: str, operation: str = "request") -> None:
     """Log request/response body if configured."""
-    if config.wikidata_log_body:
+    if config.wikidata_log_body and logger.isEnabledFor(logging.DEBUG):
         max_len = config.data_log_body_max
         body_str = str(body)
         if len(body_str) > max_len:
-            logger.debug(f"Wikidata {operation} body (truncated to {max_len}): {body_str[:max_len]}...")
+            logger.debug("Wikidata %s body (truncated to %d): %s...", operation, max_len, body_str[:max_len])
         else:
-            logger.debug(f"Wikidata {operation} body: {body_str}")
+            logger.debug("Wikidata %s body: %s", operation, body_str)
+
+
+def _search_params(query: str, limit: int, entity_type: Optional[str]) -> Dict[str, Any]:
+    """Build wbsearchentities query parameters."""
+    params: Dict[str, Any] = {
+        "action": "wbsearchentities",
+        "search": query,
+        "language": "en",
+        "format": "json",
+        "limit": limit,
+    }
+    if entity_type:
+        params["type"] = entity_type
+    return params
 
 
+@wiki_cache.cached(wiki_cache.search_key)
 def search_wikidata_entities(query: str, limit: int = 10, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
     """Search Wikidata using Elasticsearch-backed search API.
     
@@ -138,36 +211,55 @@ def search_wikidata_entities(query: str, limit: int = 10, entity_type: Optional[
     Returns:
         List of lightweight search result dictionaries with: id, label, description, aliases, match
     """
-    params = {
-        "action": "wbsearchentities",
-        "search": query,
-        "language": "en",
-        "format": "json",
-        "limit": limit,
-    }
-    if entity_type:
-        params["type"] = entity_type
+    params = _search_params(query, limit, entity_type)
     
     try:
         headers = {"User-Agent": WIKIDATA_USER_AGENT}
         logger.debug("[wikidata] elasticsearch search -> url=%s params=%s", WIKIDATA_API_URL, params)
-        response = requests.get(WIKIDATA_API_URL, params=params, headers=headers, timeout=10)
+        response = _get_session().get(WIKIDATA_API_URL, params=params, headers=headers, timeout=10)
         logger.debug("[wikidata] search response status=%s", response.status_code)
         response.raise_for_status()
         data = response.json()
         
-        if config.wikidata_log_body:
+        if config.wikidata_log_body and logger.isEnabledFor(logging.DEBUG):
             _log_body(response.text, "search_response")
         
         logger.debug("[wikidata] search response keys=%s", list(data.keys()) if isinstance(data, dict) else None)
         entities = data.get("search", [])
-        logger.info(f"[wikidata] elasticsearch search returned {len(entities)} results for query: {query}")
+        logger.info("[wikidata] elasticsearch search returned %d results for query: %s", len(entities), query)
+        return entities
+    except Exception as e:
+        logger.exception("[wikidata] elasticsearch search error: %s", e)
+        return []
+
+
+async def search_wikidata_entities_async(query: str, limit: int = 10, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Async variant of search_wikidata_entities() using the shared httpx client.
+    
+    Does not block the event loop while waiting on Wikidata, so API handlers can
+    run it concurrently with local repository searches.
+    """
+    params = _search_params(query, limit, entity_type)
+    
+    try:
+        logger.debug("[wikidata] elasticsearch search (async) -> url=%s params=%s", WIKIDATA_API_URL, params)
+        response = await _get_async_client().get(WIKIDATA_API_URL, params=params)
+        logger.debug("[wikidata] search response status=%s", response.status_code)
+        response.raise_for_status()
+        data = response.json()
+        
+        if config.wikidata_log_body and logger.isEnabledFor(logging.DEBUG):
+            _log_body(response.text, "search_response")
+        
+        entities = data.get("search", [])
+        logger.info("[wikidata] elasticsearch search returned %d results for query: %s", len(entities), query)
         return entities
     except Exception as e:
         logger.exception("[wikidata] elasticsearch search error: %s", e)
         return []
 
 
+@wiki_cache.cached(wiki_cache.entity_key)
 def get_wikidata_entity(qid: str, use_entity_data: bool = False) -> Optional[Dict[str, Any]]:
     """Get full entity data from Wikidata by QID using REST API.
     
@@ -191,11 +283,11 @@ def get_wikidata_entity(qid: str, use_entity_data: bool = False) -> Optional[Dic
             url = f"{entity_url}{qid}.json"
             headers = {"User-Agent": WIKIDATA_USER_AGENT}
             logger.debug("[wikidata] fetch entity (REST) -> url=%s", url)
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _get_session().get(url, headers=headers, timeout=10)
             logger.debug("[wikidata] entity response status=%s", response.status_code)
             response.raise_for_status()
             
-            if config.wikidata_log_body:
+            if config.wikidata_log_body and logger.isEnabledFor(logging.DEBUG):
                 try:
                     text = response.text
                     logger.debug("[wikidata] entity response body (truncated): %s", text[:config.data_log_body_max])
@@ -222,12 +314,12 @@ def get_wikidata_entity(qid: str, use_entity_data: bool = False) -> Optional[Dic
         try:
             headers = {"User-Agent": WIKIDATA_USER_AGENT}
             logger.debug("[wikidata] fetch entity (REST) -> url=%s params=%s", WIKIDATA_API_URL, params)
-            response = requests.get(WIKIDATA_API_URL, params=params, headers=headers, timeout=10)
+            response = _get_session().get(WIKIDATA_API_URL, params=params, headers=headers, timeout=10)
             logger.debug("[wikidata] entity response status=%s", response.status_code)
             response.raise_for_status()
             data = response.json()
             
-            if config.wikidata_log_body:
+            if config.wikidata_log_body and logger.isEnabledFor(logging.DEBUG):
                 _log_body(response.text, "entity_response")
             
             logger.debug("[wikidata] entity keys=%s", list(data.keys()) if isinstance(data, dict) else None)
@@ -238,6 +330,70 @@ def get_wikidata_entity(qid: str, use_entity_data: bool = False) -> Optional[Dic
             return None
 
 
+# wbgetentities accepts at most this many ids per call
+WBGETENTITIES_MAX_IDS = 50
+
+
+def _entities_params(qids: List[str]) -> Dict[str, Any]:
+    """Query parameters for one wbgetentities call."""
+    return {
+        "action": "wbgetentities",
+        "ids": "|".join(qids),
+        "props": "labels|descriptions|claims|sitelinks|aliases",
+        "languages": "en",
+        "format": "json",
+    }
+
+
+async def get_wikidata_entities_async(qids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch several entities in one wbgetentities call (up to 50 ids).
+    
+    Args:
+        qids: Wikidata entity IDs (e.g., ["Q517", "Q90"])
+    
+    Returns:
+        Mapping of QID -> full entity dictionary; missing entities are omitted
+    """
+    params = _entities_params(qids)
+    
+    try:
+        logger.debug("[wikidata] fetch entities (batch) -> url=%s ids=%s", WIKIDATA_API_URL, params["ids"])
+        response = await _get_async_client().get(WIKIDATA_API_URL, params=params)
+        logger.debug("[wikidata] entities response status=%s", response.status_code)
+        response.raise_for_status()
+        data = response.json()
+        
+        if config.wikidata_log_body and logger.isEnabledFor(logging.DEBUG):
+            _log_body(response.text, "entities_response")
+        
+        entities = data.get("entities", {})
+        return {qid: entity for qid, entity in entities.items() if "missing" not in entity}
+    except Exception as e:
+        logger.exception("[wikidata] fetch entities error for %s: %s", params["ids"], e)
+        return {}
+
+
+# Coalesces concurrent entity lookups into batched wbgetentities calls
+entity_loader = WikidataEntityLoader(
+    get_wikidata_entities_async, max_batch_size=WBGETENTITIES_MAX_IDS, batch_interval_ms=10
+)
+
+
+@wiki_cache.cached_async(wiki_cache.entity_key)
+async def get_wikidata_entity_async(qid: str) -> Optional[Dict[str, Any]]:
+    """Async counterpart of get_wikidata_entity(), batched through entity_loader.
+    
+    Args:
+        qid: Wikidata entity QID (e.g., "Q123")
+    
+    Returns:
+        Full entity dictionary, or None if not found or the id is malformed
+    """
+    if not qid or not _ENTITY_ID_RE.match(qid):
+        return None
+    return await entity_loader.load(qid)
+
+
 def _search_hit_to_wikibase_entity(search_hit: Dict[str, Any]) -> "WikibaseEntity":
     """Convert a search hit to a lightweight WikibaseEntity model.
     
@@ -245,8 +401,6 @@ def _search_hit_to_wikibase_entity(search_hit: Dict[str, Any]) -> "WikibaseEntit
     available in the search hit (label, description, aliases). This is the native Wikidata
     structure and doesn't force entities into Person/Event/Geography categories.
     """
-    from python_aws_starter.models.wikidata_meta import WikibaseEntity
-    
     qid = search_hit.get("id", "")
     label = search_hit.get("label", "")
     description = search_hit.get("description", "")
@@ -289,8 +443,8 @@ def _search_hit_to_lightweight_person(search_hit: Dict[str, Any]) -> Person:
         death_date=None,
         birth_location=None,
         death_location=None,
-        occupations=[],
-        nationalities=[],
+        occupations=(),
+        nationalities=(),
         created_by="wikidata_search",
         last_modified_by="wikidata_search",
         created_at=now,
@@ -299,13 +453,13 @@ def _search_hit_to_lightweight_person(search_hit: Dict[str, Any]) -> Person:
         descriptions={"en": {"language": "en", "value": description}} if description else {},
         aliases={},
         claims={},  # Empty - fetch full entity if claims needed
-        sources=[SourceAttribution(
+        sources=(SourceAttribution(
             source_id="wikidata_search",
             source_name="Wikidata Search",
             source_type=SourceType.SCRAPED,
             trust_level=0.7,
             fields_contributed=["name", "description"],
-        )],
+        ),),
         confidence=0.7,
     )
     return person
@@ -330,8 +484,8 @@ def _search_hit_to_lightweight_event(search_hit: Dict[str, Any]) -> Event:
         description=description or "",
         start_date=DateRange(start_date="", precision="unknown"),
         end_date=None,
-        locations=[],
-        related_people=[],
+        locations=(),
+        related_people=(),
         created_by="wikidata_search",
         last_modified_by="wikidata_search",
         created_at=now,
@@ -340,13 +494,13 @@ def _search_hit_to_lightweight_event(search_hit: Dict[str, Any]) -> Event:
         descriptions={"en": {"language": "en", "value": description}} if description else {},
         aliases={},
         claims={},  # Empty - fetch full entity if claims needed
-        sources=[SourceAttribution(
+        sources=(SourceAttribution(
             source_id="wikidata_search",
             source_name="Wikidata Search",
             source_type=SourceType.SCRAPED,
             trust_level=0.7,
             fields_contributed=["title", "description"],
-        )],
+        ),),
         confidence=0.7,
     )
     return event
@@ -379,13 +533,13 @@ def _search_hit_to_lightweight_geography(search_hit: Dict[str, Any]) -> Geograph
         descriptions={"en": {"language": "en", "value": description}} if description else {},
         aliases={},
         claims={},  # Empty - fetch full entity if claims needed
-        sources=[SourceAttribution(
+        sources=(SourceAttribution(
             source_id="wikidata_search",
             source_name="Wikidata Search",
             source_type=SourceType.SCRAPED,
             trust_level=0.7,
             fields_contributed=["name", "description"],
-        )],
+        ),),
         confidence=0.7,
     )
     return geography
@@ -403,8 +557,6 @@ def get_random_wikidata_entity(instance_of: Optional[str] = None) -> Optional["W
     Returns:
         WikibaseEntity or None if no entity found
     """
-    from python_aws_starter.models.wikidata_meta import WikibaseEntity
-    
     # Get random QID using SPARQL
     qids = get_random_wikidata_entities(limit=1, instance_of=instance_of)
     if not qids:
@@ -412,12 +564,12 @@ def get_random_wikidata_entity(instance_of: Optional[str] = None) -> Optional["W
         return None
     
     qid = qids[0]
-    logger.info(f"[wikidata] Got random QID: {qid}")
+    logger.info("[wikidata] Got random QID: %s", qid)
     
     # Fetch full entity data
     entity_data = get_wikidata_entity(qid)
     if not entity_data:
-        logger.warning(f"[wikidata] Could not fetch entity data for QID: {qid}")
+        logger.warning("[wikidata] Could not fetch entity data for QID: %s", qid)
         return None
     
     # Convert to WikibaseEntity
@@ -443,14 +595,15 @@ def get_random_wikidata_entity(instance_of: Optional[str] = None) -> Optional["W
             modified=entity_data.get("modified"),
         )
         
-        logger.info(f"[wikidata] Successfully created WikibaseEntity for {qid}")
+        logger.info("[wikidata] Successfully created WikibaseEntity for %s", qid)
         return entity
     except Exception as e:
-        logger.exception(f"[wikidata] Error converting entity {qid} to WikibaseEntity: {e}")
+        logger.exception("[wikidata] Error converting entity %s to WikibaseEntity: %s", qid, e)
         return None
 
 
-def search_wikidata_entities_as_wikibase(query: str, limit: int = 10) -> List["WikibaseEntity"]:
+@wiki_cache.cached_async(wiki_cache.search_key)
+async def search_wikidata_entities_as_wikibase(query: str, limit: int = 10) -> List["WikibaseEntity"]:
     """Search Wikidata using Elasticsearch and return native WikibaseEntity models.
     
     This is the recommended approach for Wikidata searches - returns entities in their
@@ -463,10 +616,8 @@ def search_wikidata_entities_as_wikibase(query: str, limit: int = 10) -> List["W
     Returns:
         List of lightweight WikibaseEntity models from search results
     """
-    from python_aws_starter.models.wikidata_meta import WikibaseEntity
-    
     # Use Elasticsearch search API
-    search_results = search_wikidata_entities(query, limit=limit)
+    search_results = await search_wikidata_entities_async(query, limit=limit)
     entities = []
     
     for search_hit in search_results:
@@ -478,7 +629,7 @@ def search_wikidata_entities_as_wikibase(query: str, limit: int = 10) -> List["W
         entity = _search_hit_to_wikibase_entity(search_hit)
         entities.append(entity)
     
-    logger.info(f"[wikidata] elasticsearch search returned {len(entities)} entities for query: {query}")
+    logger.info("[wikidata] elasticsearch search returned %d entities for query: %s", len(entities), query)
     return entities
 
 
@@ -512,7 +663,7 @@ def search_wikidata_people(query: str, limit: int = 10) -> List[Person]:
         if len(people) >= limit:
             break
     
-    logger.info(f"[wikidata] elasticsearch search returned {len(people)} people for query: {query}")
+    logger.info("[wikidata] elasticsearch search returned %d people for query: %s", len(people), query)
     return people
 
 
@@ -547,7 +698,7 @@ def search_wikidata_events(query: str, limit: int = 10) -> List[Event]:
         if len(events) >= limit:
             break
     
-    logger.info(f"[wikidata] elasticsearch search returned {len(events)} events for query: {query}")
+    logger.info("[wikidata] elasticsearch search returned %d events for query: %s", len(events), query)
     return events
 
 
@@ -582,7 +733,7 @@ def search_wikidata_geographies(query: str, limit: int = 10) -> List[Geography]:
         if len(geographies) >= limit:
             break
     
-    logger.info(f"[wikidata] elasticsearch search returned {len(geographies)} geographies for query: {query}")
+    logger.info("[wikidata] elasticsearch search returned %d geographies for query: %s", len(geographies), query)
     return geographies
 
 
@@ -673,8 +824,6 @@ def _parse_wikidata_date(date_value: Dict[str, Any]) -> Optional[str]:
 
 def _convert_wikidata_claims_to_model_claims(wikidata_claims: Dict[str, Any]) -> Dict[str, List[Claim]]:
     """Converts raw Wikidata claims to our Claim models."""
-    from python_aws_starter.models.claims_utils import Property
-    
     model_claims: Dict[str, List[Claim]] = {}
     for prop_id, statements_data in wikidata_claims.items():
         model_claims[prop_id] = []
@@ -694,7 +843,6 @@ def _convert_wikidata_claims_to_model_claims(wikidata_claims: Dict[str, Any]) ->
                 elif datavalue_type == DatavalueType.STRING:
                     value = datavalue_data.get("value")
                 elif datavalue_type == DatavalueType.MONOLINGUAL_TEXT:
-                    from python_aws_starter.models.wikidata_meta import MonolingualText
                     value = MonolingualText(**datavalue_data.get("value", {}))
                 elif datavalue_type == DatavalueType.GLOBE_COORDINATE:
                     value = GlobeCoordinate(**datavalue_data.get("value", {}))
@@ -715,7 +863,7 @@ def _convert_wikidata_claims_to_model_claims(wikidata_claims: Dict[str, Any]) ->
                 )
                 model_claims[prop_id].append(claim)
             except Exception as e:
-                logger.warning(f"Failed to convert Wikidata claim for property {prop_id}: {e}")
+                logger.warning("Failed to convert Wikidata claim for property %s: %s", prop_id, e)
     return model_claims
 
 
@@ -788,8 +936,8 @@ def wikidata_to_person(entity: Dict[str, Any], qid: str, search_hit: Optional[Di
             death_date=death_date,
             birth_location=None,
             death_location=None,
-            occupations=occupations,
-            nationalities=nationalities,
+            occupations=tuple(occupations),
+            nationalities=tuple(nationalities),
             created_by="wikidata",
             last_modified_by="wikidata",
             created_at=now,
@@ -798,13 +946,13 @@ def wikidata_to_person(entity: Dict[str, Any], qid: str, search_hit: Optional[Di
             descriptions=descriptions,
             aliases=aliases,
             claims=_convert_wikidata_claims_to_model_claims(claims),
-            sources=[source],
+            sources=(source,),
             confidence=0.8,
         )
         
         return person
     except Exception as e:
-        logger.error(f"Error converting Wikidata entity to Person: {e}")
+        logger.error("Error converting Wikidata entity to Person: %s", e)
         return None
 
 
@@ -821,13 +969,11 @@ def wikidata_to_event(entity: Dict[str, Any], qid: str, search_hit: Optional[Dic
         claims = entity.get("claims", {})
         
         # Extract dates using property synonyms configuration
-        from python_aws_starter.models.property_synonyms import get_start_date_properties, get_end_date_properties
-        
         start_date = None
         end_date = None
         
         # Try all start date synonyms in priority order
-        for prop_id in get_start_date_properties():
+        for prop_id in START_DATE_PROPERTY_ORDER:
             start_val = _get_claim_value(claims, prop_id)
             if start_val:
                 start_date = _parse_wikidata_date(start_val)
@@ -835,7 +981,7 @@ def wikidata_to_event(entity: Dict[str, Any], qid: str, search_hit: Optional[Dic
                     break  # Use first found start date
         
         # Try all end date synonyms in priority order
-        for prop_id in get_end_date_properties():
+        for prop_id in END_DATE_PROPERTY_ORDER:
             end_val = _get_claim_value(claims, prop_id)
             if end_val:
                 end_date = _parse_wikidata_date(end_val)
@@ -885,8 +1031,8 @@ def wikidata_to_event(entity: Dict[str, Any], qid: str, search_hit: Optional[Dic
             description=description,
             start_date=date_range,
             end_date=DateRange(start_date=end_date or "", end_date=end_date or "") if end_date else None,
-            locations=locations,
-            related_people=[],
+            locations=tuple(locations),
+            related_people=(),
             created_by="wikidata",
             last_modified_by="wikidata",
             created_at=now,
@@ -895,13 +1041,13 @@ def wikidata_to_event(entity: Dict[str, Any], qid: str, search_hit: Optional[Dic
             descriptions=descriptions,
             aliases=aliases,
             claims=_convert_wikidata_claims_to_model_claims(claims),
-            sources=[source],
+            sources=(source,),
             confidence=0.8,
         )
         
         return event
     except Exception as e:
-        logger.error(f"Error converting Wikidata entity to Event: {e}")
+        logger.error("Error converting Wikidata entity to Event: %s", e)
         return None
 
 
@@ -975,13 +1121,13 @@ def wikidata_to_geography(entity: Dict[str, Any], qid: str, search_hit: Optional
             descriptions=descriptions,
             aliases=aliases,
             claims=_convert_wikidata_claims_to_model_claims(claims),
-            sources=[source],
+            sources=(source,),
             confidence=0.8,
         )
         
         return geography
     except Exception as e:
-        logger.error(f"Error converting Wikidata entity to Geography: {e}")
+        logger.error("Error converting Wikidata entity to Geography: %s", e)
         return None
 
 
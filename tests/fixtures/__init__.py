@@ -45,7 +45,7 @@ def sample_event_wwii():
         description="Major global military conflict spanning 1939-1945",
         start_date=DateRange(start_date="1939-09-01", end_date="1945-09-02", precision="day"),
         end_date=None,
-        sources=[
+        sources=(
             SourceAttribution(
                 source_id="wikipedia",
                 source_name="Wikipedia",
@@ -53,8 +53,8 @@ def sample_event_wwii():
                 fields_contributed=["title", "description"],
                 external_id=None,
                 url="https://en.wikipedia.org/wiki/World_War_II",
-            )
-        ],
+            ),
+        ),
         source_of_truth=None,
         conflict_notes=None,
         created_by="data_importer",
@@ -73,8 +73,8 @@ def sample_person_churchill():
         birth_location="Woodstock, England",
         death_location=None,
         description="British statesman and military officer",
-        occupations=["politician", "military officer", "author"],
-        nationalities=["British"],
+        occupations=("politician", "military officer", "author"),
+        nationalities=("British",),
         source_of_truth=None,
         conflict_notes=None,
         created_by="data_importer",
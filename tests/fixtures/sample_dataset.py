@@ -150,8 +150,8 @@ PEOPLE = [
         death_date="1821-05-05",
         birth_location="Ajaccio, Corsica",
         death_location=None,
-        occupations=["military leader", "emperor"],
-        nationalities=["French"],
+        occupations=("military leader", "emperor"),
+        nationalities=("French",),
         created_by="sample_data",
         last_modified_by="sample_data",
         labels={"en": {"language": "en", "value": "Napoleon Bonaparte"}},
@@ -168,10 +168,10 @@ PEOPLE = [
         description="British Prime Minister during WWII",
         birth_date="1874-11-30",
         death_date="1965-01-24",
-        occupations=["politician", "writer"],
+        occupations=("politician", "writer"),
         birth_location=None,
         death_location=None,
-        nationalities=["British"],
+        nationalities=("British",),
         created_by="sample_data",
         last_modified_by="sample_data",
         labels={"en": {"language": "en", "value": "Winston Churchill"}},
@@ -188,8 +188,8 @@ PEOPLE = [
         description="French heroine and military leader",
         birth_date="1412-01-06",
         death_date="1431-05-30",
-        occupations=["military leader"],
-        nationalities=["French"],
+        occupations=("military leader",),
+        nationalities=("French",),
         created_by="sample_data",
         last_modified_by="sample_data",
         labels={"en": {"language": "en", "value": "Joan of Arc"}},
@@ -206,8 +206,8 @@ PEOPLE = [
         description="Roman general and statesman",
         birth_date="100-07-13",
         death_date="44-03-15",
-        occupations=["general", "politician"],
-        nationalities=["Roman"],
+        occupations=("general", "politician"),
+        nationalities=("Roman",),
         created_by="sample_data",
         last_modified_by="sample_data",
     ),
@@ -217,8 +217,8 @@ PEOPLE = [
         description="16th President of the United States",
         birth_date="1809-02-12",
         death_date="1865-04-15",
-        occupations=["politician"],
-        nationalities=["American"],
+        occupations=("politician",),
+        nationalities=("American",),
         created_by="sample_data",
         last_modified_by="sample_data",
     ),
@@ -228,8 +228,8 @@ PEOPLE = [
         description="Last active ruler of the Ptolemaic Kingdom of Egypt",
         birth_date="69-01-01",
         death_date="30-08-12",
-        occupations=["ruler"],
-        nationalities=["Egyptian"],
+        occupations=("ruler",),
+        nationalities=("Egyptian",),
         created_by="sample_data",
         last_modified_by="sample_data",
     ),
@@ -239,8 +239,8 @@ PEOPLE = [
         description="Leader of Nazi Germany",
         birth_date="1889-04-20",
         death_date="1945-04-30",
-        occupations=["politician"],
-        nationalities=["Austrian", "German"],
+        occupations=("politician",),
+        nationalities=("Austrian", "German"),
         created_by="sample_data",
         last_modified_by="sample_data",
     ),
@@ -253,17 +253,17 @@ EVENTS = [
         title="French Revolution",
         description="Period of radical social and political change in France (1789–1799)",
         start_date=DateRange(start_date="1789-05-05", end_date="1799-11-09", precision="year"),
-        locations=[GeographicReference(geography_id="geo_france", name="France")],
-        related_people=[EventPersonRef(person_id="person_napoleon", name="Napoleon Bonaparte", role="Rising Leader")],
-        sources=[
+        locations=(GeographicReference(geography_id="geo_france", name="France"),),
+        related_people=(EventPersonRef(person_id="person_napoleon", name="Napoleon Bonaparte", role="Rising Leader"),),
+        sources=(
             SourceAttribution(
                 source_id="wikipedia",
                 source_name="Wikipedia",
                 trust_level=0.7,
                 fields_contributed=["title", "dates", "description"],
                 url="https://en.wikipedia.org/wiki/French_Revolution",
-            )
-        ],
+            ),
+        ),
         confidence=0.85,
         created_by="sample_data",
         last_modified_by="sample_data",
@@ -280,9 +280,9 @@ EVENTS = [
         title="Battle of Waterloo",
         description="Decisive battle near Waterloo in 1815 ending Napoleon's rule.",
         start_date=DateRange(start_date="1815-06-18", precision="day"),
-        locations=[GeographicReference(geography_id="geo_waterloo", name="Waterloo")],
-        related_people=[EventPersonRef(person_id="person_napoleon", name="Napoleon Bonaparte", role="Commander")],
-        sources=[
+        locations=(GeographicReference(geography_id="geo_waterloo", name="Waterloo"),),
+        related_people=(EventPersonRef(person_id="person_napoleon", name="Napoleon Bonaparte", role="Commander"),),
+        sources=(
             SourceAttribution(
                 source_id="curated_internal",
                 source_name="Curated Internal",
@@ -290,8 +290,8 @@ EVENTS = [
                 fields_contributed=["title", "dates"],
                 external_id=None,
                 url=None,
-            )
-        ],
+            ),
+        ),
         confidence=0.9,
         created_by="sample_data",
         last_modified_by="sample_data",
@@ -307,20 +307,20 @@ EVENTS = [
         title="World War II",
         description="Global war from 1939 to 1945",
         start_date=DateRange(start_date="1939-09-01", end_date="1945-09-02", precision="day"),
-        locations=[GeographicReference(geography_id="geo_europe", name="Europe"), GeographicReference(geography_id="geo_uk", name="United Kingdom")],
-        related_people=[
+        locations=(GeographicReference(geography_id="geo_europe", name="Europe"), GeographicReference(geography_id="geo_uk", name="United Kingdom")),
+        related_people=(
             EventPersonRef(person_id="person_churchill", name="Winston Churchill", role="Allied Leader"),
             EventPersonRef(person_id="person_hitler", name="Adolf Hitler", role="Axis Leader"),
-        ],
-        sources=[
+        ),
+        sources=(
             SourceAttribution(
                 source_id="wikipedia",
                 source_name="Wikipedia",
                 trust_level=0.7,
                 fields_contributed=["dates", "overview"],
                 url="https://en.wikipedia.org/wiki/World_War_II",
-            )
-        ],
+            ),
+        ),
         confidence=0.95,
         created_by="sample_data",
         last_modified_by="sample_data",
@@ -336,16 +336,16 @@ EVENTS = [
         title="Battle of Hastings",
         description="1066 battle leading to Norman conquest of England",
         start_date=DateRange(start_date="1066-10-14", precision="day"),
-        locations=[GeographicReference(geography_id="geo_uk", name="England")],
-        related_people=[],
-        sources=[
+        locations=(GeographicReference(geography_id="geo_uk", name="England"),),
+        related_people=(),
+        sources=(
             SourceAttribution(
                 source_id="wikipedia",
                 source_name="Wikipedia",
                 trust_level=0.7,
                 fields_contributed=["title", "dates"],
-            )
-        ],
+            ),
+        ),
         confidence=0.8,
         created_by="sample_data",
         last_modified_by="sample_data",
@@ -355,16 +355,16 @@ EVENTS = [
         title="Fall of the Western Roman Empire",
         description="Traditional date for the fall of Rome in 476 CE",
         start_date=DateRange(start_date="0476-09-04", precision="year"),
-        locations=[GeographicReference(geography_id="geo_rome", name="Rome")],
-        related_people=[EventPersonRef(person_id="person_caesar", name="Julius Caesar", role="Ancient Precursor")],
-        sources=[
+        locations=(GeographicReference(geography_id="geo_rome", name="Rome"),),
+        related_people=(EventPersonRef(person_id="person_caesar", name="Julius Caesar", role="Ancient Precursor"),),
+        sources=(
             SourceAttribution(
                 source_id="curated_internal",
                 source_name="Curated Internal",
                 trust_level=0.9,
                 fields_contributed=["title", "dates"],
-            )
-        ],
+            ),
+        ),
         confidence=0.7,
         created_by="sample_data",
         last_modified_by="sample_data",
@@ -374,16 +374,16 @@ EVENTS = [
         title="American Civil War",
         description="Civil war in the United States (1861–1865)",
         start_date=DateRange(start_date="1861-04-12", end_date="1865-05-09", precision="day"),
-        locations=[],
-        related_people=[EventPersonRef(person_id="person_lincoln", name="Abraham Lincoln", role="President")],
-        sources=[
+        locations=(),
+        related_people=(EventPersonRef(person_id="person_lincoln", name="Abraham Lincoln", role="President"),),
+        sources=(
             SourceAttribution(
                 source_id="wikipedia",
                 source_name="Wikipedia",
                 trust_level=0.7,
                 fields_contributed=["dates", "overview"],
-            )
-        ],
+            ),
+        ),
         confidence=0.9,
         created_by="sample_data",
         last_modified_by="sample_data",
@@ -393,16 +393,16 @@ EVENTS = [
         title="Reign of Cleopatra VII",
         description="Period during which Cleopatra VII ruled Egypt",
         start_date=DateRange(start_date="-51-01-01", end_date="-30-08-12", precision="year"),
-        locations=[GeographicReference(geography_id="geo_rome", name="Rome")],
-        related_people=[EventPersonRef(person_id="person_cleopatra", name="Cleopatra VII", role="Ruler")],
-        sources=[
+        locations=(GeographicReference(geography_id="geo_rome", name="Rome"),),
+        related_people=(EventPersonRef(person_id="person_cleopatra", name="Cleopatra VII", role="Ruler"),),
+        sources=(
             SourceAttribution(
                 source_id="user_submission",
                 source_name="User Submission",
                 trust_level=0.5,
                 fields_contributed=["dates", "biography"],
-            )
-        ],
+            ),
+        ),
         confidence=0.6,
         created_by="sample_user",
         last_modified_by="sample_user",
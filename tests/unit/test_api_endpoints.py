@@ -1,5 +1,8 @@
 from fastapi.testclient import TestClient
+from python_aws_starter.api import app as app_module
 from python_aws_starter.api.app import app
+from python_aws_starter.models.wikidata_meta import WikibaseEntity
+from python_aws_starter.utils import wiki_cache
 
 
 client = TestClient(app)
@@ -30,3 +33,88 @@ def test_search_geographies_api_proximity():
     data = resp.json()
     ids = [d["id"] for d in data]
     assert "geo_paris" in ids
+
+
+def test_search_people_merges_wikidata_and_local(monkeypatch):
+    async def fake_search(query, limit=10):
+        return [WikibaseEntity(id="Q517", type="item", labels={"en": {"language": "en", "value": query}})]
+
+    monkeypatch.setattr(app_module.config, "data_source", "wikidata")
+    monkeypatch.setattr(app_module.wd, "search_wikidata_entities_as_wikibase", fake_search)
+    resp = client.get("/search/people", params={"q": "Napoleon"})
+    assert resp.status_code == 200
+    ids = [d["id"] for d in resp.json()]
+    assert ids[0] == "Q517"
+    assert "person_napoleon" in ids
+
+
+def test_search_people_skips_wikidata_errors(monkeypatch):
+    async def failing_search(query, limit=10):
+        raise RuntimeError("wikidata unavailable")
+
+    monkeypatch.setattr(app_module.config, "data_source", "wikidata")
+    monkeypatch.setattr(app_module.wd, "search_wikidata_entities_as_wikibase", failing_search)
+    resp = client.get("/search/people", params={"q": "Napoleon"})
+    assert resp.status_code == 200
+    assert [d["id"] for d in resp.json()] == ["person_napoleon"]
+
+
+def test_wikidata_entity_route_normalizes_qid_case(monkeypatch):
+    loaded = []
+
+    class FakeLoader:
+        async def load(self, qid):
+            loaded.append(qid)
+            return {"id": qid, "claims": {}}
+
+    wiki_cache.flush()
+    monkeypatch.setattr(app_module.wd, "entity_loader", FakeLoader())
+    for path in ("/wikidata/entity/q90", "/wikidata/entity/Q90", "/wikidata/entity/geo_wikidata_q90"):
+        resp = client.get(path)
+        assert resp.status_code == 200
+        assert resp.json()["id"] == "Q90"
+    assert loaded == ["Q90"]
+    wiki_cache.flush()
+
+
+def test_entity_claims_resolves_any_dimension():
+    for entity_id in ("person_napoleon", "event_waterloo", "geo_paris"):
+        resp = client.get(f"/entity/{entity_id}/claims")
+        assert resp.status_code == 200
+        assert resp.json()["entity_id"] == entity_id
+
+    assert client.get("/entity/does_not_exist/claims").status_code == 404
+    assert client.get("/entity/does_not_exist/claim/P31").status_code == 404
+
+
+def test_search_by_property_uses_value_and_type():
+    resp = client.get("/search/by-property", params={"property_id": "P569", "value": "1769-08-15"})
+    assert resp.status_code == 200
+    assert [d["id"] for d in resp.json()] == ["person_napoleon"]
+
+    resp = client.get("/search/by-property", params={"property_id": "P569", "entity_type": "event"})
+    assert resp.json() == []
+
+
+def test_search_sets_etag_and_honours_if_none_match():
+    resp = client.get("/search/events", params={"text": "Waterloo"})
+    assert resp.status_code == 200
+    etag = resp.headers["etag"]
+    assert resp.headers["cache-control"] == "public, max-age=60"
+
+    resp = client.get("/search/events", params={"text": "Waterloo"}, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+
+    # Non-search endpoints are left alone
+    assert "etag" not in client.get("/pivot", params={"from": "people", "to": "events", "id": "person_napoleon"}).headers
+
+
+def test_cors_preflight_is_cacheable():
+    resp = client.options(
+        "/search/events",
+        headers={"Origin": "http://localhost:8080", "Access-Control-Request-Method": "GET"},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["access-control-max-age"] == "86400"
+    assert "GET" in resp.headers["access-control-allow-methods"]
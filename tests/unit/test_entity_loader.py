@@ -0,0 +1,70 @@
+"""Unit tests for the batching Wikidata entity loader."""
+import asyncio
+
+from python_aws_starter.utils.entity_loader import WikidataEntityLoader
+
+
+def test_concurrent_loads_share_one_batch():
+    batches = []
+
+    async def fetch(qids):
+        batches.append(list(qids))
+        return {qid: {"id": qid} for qid in qids if qid != "Q404"}
+
+    loader = WikidataEntityLoader(fetch, max_batch_size=50, batch_interval_ms=5)
+
+    async def burst():
+        return await asyncio.gather(*(loader.load(q) for q in ["Q1", "Q2", "Q1", "Q404"]))
+
+    results = asyncio.run(burst())
+    assert results == [{"id": "Q1"}, {"id": "Q2"}, {"id": "Q1"}, None]
+    assert batches == [["Q1", "Q2", "Q404"]]
+
+
+def test_batches_are_capped_at_max_batch_size():
+    batches = []
+
+    async def fetch(qids):
+        batches.append(len(qids))
+        return {qid: qid for qid in qids}
+
+    loader = WikidataEntityLoader(fetch, max_batch_size=2, batch_interval_ms=5)
+
+    async def burst():
+        return await asyncio.gather(*(loader.load(f"Q{i}") for i in range(5)))
+
+    assert asyncio.run(burst()) == [f"Q{i}" for i in range(5)]
+    assert batches == [2, 2, 1]
+
+
+def test_batch_errors_propagate_to_every_caller():
+    async def fetch(qids):
+        raise RuntimeError("boom")
+
+    loader = WikidataEntityLoader(fetch, batch_interval_ms=1)
+
+    async def burst():
+        return await asyncio.gather(loader.load("Q1"), loader.load("Q2"), return_exceptions=True)
+
+    results = asyncio.run(burst())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_cancelled_batch_cancels_every_caller():
+    started = asyncio.Event()
+
+    async def fetch(qids):
+        started.set()
+        await asyncio.sleep(10)
+
+    loader = WikidataEntityLoader(fetch, batch_interval_ms=1)
+
+    async def burst():
+        loads = asyncio.gather(loader.load("Q1"), loader.load("Q2"), return_exceptions=True)
+        await started.wait()
+        for task in list(loader._inflight):
+            task.cancel()
+        return await asyncio.wait_for(loads, timeout=1)
+
+    results = asyncio.run(burst())
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
@@ -1,12 +1,40 @@
 """Unit tests for data models."""
 
+import datetime as dt
+import json
+import sys
+
 import pytest
+from pydantic import ValidationError
+
+import python_aws_starter.models as models
+from python_aws_starter.models.base import BaseEntity
 from python_aws_starter.models.events import Event, DateRange
 from python_aws_starter.models.people import Person
 from python_aws_starter.models.geography import Geography, GeographyType
 from python_aws_starter.models.dimensions import Dimension, DimensionType
-from python_aws_starter.models.sources import DataSource, SourceType
+from python_aws_starter.models.sources import DataSource, SourceAttribution, SourceType
 from python_aws_starter.models.contributions import UserContribution, ContributionType
+from python_aws_starter.models.claims_utils import (
+    Property,
+    create_coordinate_claim,
+    create_entity_claim,
+    create_string_claim,
+    create_time_claim,
+    is_iso_date,
+)
+from python_aws_starter.models.property_synonyms import (
+    START_DATE_PROPERTIES,
+    get_end_date_properties,
+    get_start_date_properties,
+)
+from python_aws_starter.models.wikidata_meta import (
+    Datavalue,
+    GlobeCoordinate,
+    TimeValue,
+    WikibaseEntity,
+    WikibaseEntityId,
+)
 
 
 def test_event_creation():
@@ -110,8 +138,6 @@ def test_data_source_creation():
 
 def test_event_with_multi_source():
     """Test event with multiple sources."""
-    from python_aws_starter.models.sources import SourceAttribution
-
     event = Event(
         id="event_001",
         title="World War II",
@@ -146,8 +172,6 @@ def test_event_with_multi_source():
 
 def test_entity_with_claims():
     """Test entity with Wikidata-style claims."""
-    from python_aws_starter.models.claims_utils import Property, create_time_claim
-    
     person = Person(
         id="person_test",
         name="Test Person",
@@ -167,8 +191,6 @@ def test_entity_with_claims():
 
 def test_entity_claims_access():
     """Test accessing entity data through claims."""
-    from python_aws_starter.models.claims_utils import Property, create_time_claim, create_coordinate_claim
-    
     geography = Geography(
         id="geo_test",
         name="Test City",
@@ -187,3 +209,140 @@ def test_entity_claims_access():
     assert coord is not None
     assert coord.latitude == 40.7128
     assert coord.longitude == -74.0060
+
+
+def test_get_best_claim_rank_order():
+    """Preferred beats normal beats deprecated, whatever the list order."""
+    deprecated = create_string_claim("P1", "deprecated").model_copy(update={"rank": "deprecated"})
+    normal = create_string_claim("P1", "normal")
+    preferred = create_string_claim("P1", "preferred").model_copy(update={"rank": "preferred"})
+    person = Person(id="p", name="P", description="", created_by="t", last_modified_by="t", claims={"P1": [deprecated, normal, preferred]})
+
+    assert person.get_best_claim("P1") is preferred
+    person.claims["P1"] = [deprecated, normal]
+    assert person.get_best_claim("P1") is normal
+    person.claims["P1"] = [deprecated]
+    assert person.get_best_claim("P1") is deprecated
+    assert person.get_best_claim("P2") is None
+
+    entity = WikibaseEntity(id="Q1", type="item", claims={"P1": [deprecated, normal, preferred]})
+    assert entity.get_best_claim("P1") is preferred
+    entity.claims["P1"] = [deprecated, normal]
+    assert entity.get_best_claim("P1") is normal
+    assert entity.get_best_claim("P2") is None
+
+
+def test_nested_models_are_not_copied():
+    """Nested model instances are stored by reference, not revalidated/copied."""
+    date_range = DateRange(start_date="1815-06-18", end_date=None)
+    event = Event(
+        id="event_nested",
+        title="Nested",
+        description="Nested model identity",
+        start_date=date_range,
+        created_by="test_user",
+        last_modified_by="test_user",
+    )
+    assert event.start_date is date_range
+    assert Event.model_config["revalidate_instances"] == "never"
+
+
+def test_single_base_entity_definition():
+    """Every entity model shares the one claims-enabled BaseEntity class."""
+    assert models.BaseEntity is BaseEntity
+    assert BaseEntity.__pydantic_core_schema__ is not None
+    for model in (Event, Person, Geography, Dimension):
+        assert BaseEntity in model.__mro__
+        assert issubclass(model, models.BaseEntity)
+
+
+def test_claims_are_frozen_and_share_entity_values():
+    """Claim trees are immutable, so identical entity values are shared between claims."""
+    first = create_entity_claim("P31", "Q5")
+    second = create_entity_claim("P31", "Q5")
+    assert first.mainsnak.datavalue is second.mainsnak.datavalue
+    with pytest.raises(ValidationError):
+        first.rank = "preferred"
+    with pytest.raises(ValidationError):
+        first.mainsnak.datavalue.value.id = "Q6"
+
+
+def test_unset_metadata_is_none_but_serializes_as_empty_dict():
+    """Entities without metadata don't allocate one, yet the wire format keeps ``{}``."""
+    a = Person(id="p1", name="A", description="", created_by="t", last_modified_by="t")
+    b = Person(id="p2", name="B", description="", created_by="t", last_modified_by="t", metadata={"k": 1})
+    assert a.metadata is None
+    assert a.model_dump()["metadata"] == {}
+    assert '"metadata":{}' in a.model_dump_json()
+    assert b.model_dump(mode="json")["metadata"] == {"k": 1}
+
+
+def test_create_time_claim_accepts_dates():
+    """date objects and Wikidata time strings format the same as ISO strings."""
+    def time_of(claim):
+        return claim.mainsnak.datavalue.value.time
+
+    assert time_of(create_time_claim("P569", dt.date(1769, 8, 15))) == "+1769-08-15T00:00:00Z"
+    assert time_of(create_time_claim("P569", "+1769-08-15T00:00:00Z")) == "+1769-08-15T00:00:00Z"
+
+
+def test_computed_start_date_precision_from_claims():
+    """Zero-filled Wikidata dates report year/month precision, full dates day."""
+    def precision_of(date_str):
+        event = Event(
+            id="e1", title="T", description="", start_date=DateRange(start_date="1900"),
+            created_by="t", last_modified_by="t",
+            claims={"P580": [create_time_claim("P580", date_str)]},
+        )
+        return event.get_computed_start_date().precision
+
+    assert precision_of("1815-06-18") == "day"
+    assert precision_of("1815-06-00") == "month"
+    assert precision_of("1815-00-00") == "year"
+
+
+def test_is_iso_date_accepts_wikidata_date_shapes():
+    for ok in ("1815", "1815-06-18", "-0044-03-15", "+1769-08-15T00:00:00", "-10000-00-00", "-13798000000-00-00"):
+        assert is_iso_date(ok), ok
+    for bad in (None, "", "181", "1815-06-18garbage", "June 1815"):
+        assert not is_iso_date(bad), bad
+
+
+def test_date_property_lists_are_cached_in_priority_order():
+    """The synonym helpers hand out one shared tuple, in declaration (priority) order."""
+    assert get_start_date_properties() is get_start_date_properties()
+    assert get_end_date_properties() is get_end_date_properties()
+    assert list(get_start_date_properties()) == [p.property_id for p in START_DATE_PROPERTIES]
+
+
+def test_parsed_property_ids_and_ranks_are_interned():
+    """Property-ID keys, snak properties and ranks come back as the interned strings."""
+    pid = "".join(["P", "569"])
+    payload = {
+        "id": "Q1",
+        "type": "item",
+        "claims": {pid: [{"mainsnak": {"snaktype": "value", "property": pid}, "rank": "normal"}]},
+    }
+    entity = WikibaseEntity.model_validate_json(json.dumps(payload))
+    key = next(iter(entity.claims))
+    claim = entity.claims[key][0]
+    assert key is sys.intern("P569")
+    assert claim.mainsnak.property is key
+    assert claim.rank is sys.intern("normal")
+
+
+def test_datavalue_value_dispatches_on_type():
+    """Raw, JSON and prebuilt values resolve to the model for ``type``; misfits stay plain dicts."""
+    time_raw = {"type": "time", "value": {"time": "+1769-08-15T00:00:00Z", "precision": 11}}
+    assert type(Datavalue.model_validate(time_raw).value) is TimeValue
+    assert type(Datavalue.model_validate_json(json.dumps(time_raw)).value) is TimeValue
+    entity_raw = {"type": "wikibase-entityid", "value": {"entity-type": "item", "numeric-id": 90, "id": "Q90"}}
+    assert Datavalue.model_validate(entity_raw).value == WikibaseEntityId(id="Q90")
+    coord = GlobeCoordinate(latitude=48.85, longitude=2.35)
+    assert Datavalue(type="globecoordinate", value=coord).value is coord
+    assert Datavalue(type="url", value="https://example.org").value == "https://example.org"
+    assert Datavalue(type="url", value={"unknown": 1}).value == {"unknown": 1}
+    # A malformed value falls back to the catch-all instead of rejecting the entity
+    bad_time = {"time": "+1769-08-15T00:00:00Z", "precision": "day"}
+    assert Datavalue.model_validate({"type": "time", "value": bad_time}).value == bad_time
+    assert type(Datavalue.model_validate({"type": "external-id", "value": time_raw["value"]}).value) is dict
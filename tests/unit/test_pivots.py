@@ -40,3 +40,18 @@ def test_pivot_router(repo):
 def test_geos_by_event(repo):
     geos = repo.get_geos_by_event("event_fall_rome")
     assert any(g.id == "geo_rome" for g in geos)
+
+
+def test_repository_stores_are_read_only(repo):
+    with pytest.raises(TypeError):
+        repo.events["event_new"] = repo.events["event_waterloo"]
+    assert not hasattr(repo, "__dict__")
+    assert repo.list_events() == tuple(repo.events.values())
+    assert repo.list_events() is repo.list_events()
+
+
+def test_iter_events_by_person_streams_pivot(repo):
+    it = repo.iter_events_by_person("person_napoleon")
+    assert next(it) is repo.get_events_by_person("person_napoleon")[0]
+    assert list(repo.iter_events_by_geo("geo_waterloo")) == repo.get_events_by_geo("geo_waterloo")
+    assert list(repo.iter_pivot("people", "events", "missing")) == []
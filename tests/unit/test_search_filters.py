@@ -1,4 +1,11 @@
+import numpy as np
+
+from python_aws_starter.models.claims_utils import create_time_claim
+from python_aws_starter.models.events import DateRange, Event
+from python_aws_starter.models.people import Person
+from python_aws_starter.models.references import GeographicReference
 from python_aws_starter.repositories.in_memory import InMemoryRepository
+from python_aws_starter.utils.geo import haversine_km, haversine_km_vec
 from tests.fixtures import sample_dataset as sd
 
 
@@ -26,6 +33,9 @@ def test_search_events_geography():
     res = repo.search_events(geography_id="geo_rome")
     ids = [e.id for e in res]
     assert "event_fall_rome" in ids or "event_cleopatra" in ids
+    expected = [e.id for e in repo.list_events() if any(loc.geography_id == "geo_rome" for loc in e.locations)]
+    assert ids == expected
+    assert repo.search_events(geography_id="geo_missing") == []
 
 
 def test_search_geographies_proximity():
@@ -41,3 +51,109 @@ def test_search_people_by_text():
     res = repo.search_people(text="Napoleon")
     ids = [p.id for p in res]
     assert "person_napoleon" in ids
+
+
+def test_search_geographies_proximity_matches_full_scan():
+    repo = make_repo()
+    for center, km in [((48.8566, 2.3522), 10), ((50.68, 4.41), 400), ((41.9, 12.5), 3000), ((0.0, 0.0), 1)]:
+        res = repo.search_geographies(center_coord=center, within_km=km)
+        expected = [
+            g for g in repo.list_geographies()
+            if g.center_coordinate is not None
+            and repo._haversine_km(center[0], center[1], g.center_coordinate.latitude, g.center_coordinate.longitude) <= km
+        ]
+        assert [g.id for g in res] == [g.id for g in expected]
+
+
+def test_search_events_proximity_matches_full_scan():
+    repo = make_repo()
+    for center, km in [((50.68, 4.41), 50), ((41.9, 12.5), 1500), ((0.0, 0.0), 1)]:
+        res = repo.search_events(center_coord=center, within_km=km)
+        expected = [
+            e for e in repo.list_events()
+            if any(
+                loc.latitude is not None and loc.longitude is not None
+                and repo._haversine_km(center[0], center[1], loc.latitude, loc.longitude) <= km
+                for loc in e.locations
+            )
+        ]
+        assert [e.id for e in res] == [e.id for e in expected]
+
+
+def test_search_events_proximity_uses_location_coordinates():
+    def event(eid, *coords):
+        return Event(
+            id=eid, title=eid, description="", start_date=DateRange(start_date="1815-06-18"),
+            created_by="t", last_modified_by="t",
+            locations=[GeographicReference(geography_id=f"g{i}", name="", latitude=lat, longitude=lon)
+                       for i, (lat, lon) in enumerate(coords)],
+        )
+
+    events = [
+        event("near", (50.68, 4.41)),
+        event("far", (41.9, 12.5)),
+        event("both", (41.9, 12.5), (50.7, 4.4)),
+        event("unlocated", (None, None)),
+    ]
+    repo = InMemoryRepository(events=events, people=[], geographies=[])
+    assert [e.id for e in repo.search_events(center_coord=(50.68, 4.41), within_km=10)] == ["near", "both"]
+    assert [e.id for e in repo.search_events(center_coord=(-33.9, 151.2), within_km=10)] == []
+
+
+def test_search_by_property_keeps_types_apart_on_shared_ids():
+    common = {"description": "", "created_by": "t", "last_modified_by": "t"}
+    dob = {"P569": [create_time_claim("P569", "1769-08-15")]}
+    people = [Person(id="x2", name="B", **common), Person(id="x1", name="A", claims=dob, **common)]
+    events = [
+        Event(id="x1", title="E1", start_date=DateRange(start_date="1815"), **common),
+        Event(id="x3", title="E3", start_date=DateRange(start_date="1815"), claims=dob, **common),
+    ]
+    repo = InMemoryRepository(events=events, people=people, geographies=[])
+    assert [(type(e).__name__, e.id) for e in repo.search_by_property("P569")] == [("Person", "x1"), ("Event", "x3")]
+    assert [e.id for e in repo.search_by_property("P569", value="1769-08-15", entity_type="event")] == ["x3"]
+    # An empty value is ignored, as no value
+    assert repo.search_by_property("P569", value="") == repo.search_by_property("P569")
+
+
+def test_search_events_date_range_overlap_uses_end_dates():
+    def event(eid, start, end=None):
+        return Event(
+            id=eid, title=eid, description="", created_by="t", last_modified_by="t",
+            start_date=DateRange(start_date=start), end_date=DateRange(start_date=end) if end else None,
+        )
+
+    repo = InMemoryRepository(
+        events=[event("ww2", "1939-09-01", "1945-09-02"), event("waterloo", "1815-06-18"), event("undated", "c. 1500")],
+        people=[], geographies=[],
+    )
+    ids = [e.id for e in repo.search_events(start_date="1944-01-01", end_date="1944-12-31")]
+    # Overlaps via its end date; unparseable dates are not filtered out
+    assert ids == ["ww2", "undated"]
+
+
+def test_search_people_and_geographies_text_is_case_insensitive_per_field():
+    repo = make_repo()
+    assert "person_napoleon" in [p.id for p in repo.search_people(text="MILITARY LEADER")]
+    assert "geo_europe" in [g.id for g in repo.search_geographies(text="continent of")]
+    # Fields are matched separately, never across the name/description boundary
+    assert "person_napoleon" not in [p.id for p in repo.search_people(text="bonaparte french")]
+
+
+def test_search_events_text_narrows_from_cached_prefix():
+    repo = make_repo()
+    for query in ["w", "wa", "wat", "Water", "waterloo", "wa"]:
+        assert repo.search_events(text=query) == make_repo().search_events(text=query)
+    # Different non-text filters never share a cache entry
+    assert repo.search_events(text="waterloo", start_date="1900-01-01") == []
+    assert [e.id for e in repo.search_events(text="waterloo")] == ["event_waterloo"]
+    assert len(repo._search_cache) <= 64
+
+
+def test_haversine_scalar_and_vector_agree():
+    lats = np.array([48.8566, 51.5074, -33.8688, 48.8566])
+    lons = np.array([2.3522, -0.1278, 151.2093, 2.3522])
+    vec = haversine_km_vec(48.8566, 2.3522, lats, lons)
+    assert vec[0] == 0.0 and vec[3] == 0.0
+    assert abs(vec[1] - 343.5) < 1.0  # Paris -> London
+    for i in range(len(lats)):
+        assert abs(vec[i] - haversine_km(48.8566, 2.3522, lats[i], lons[i])) < 1e-6
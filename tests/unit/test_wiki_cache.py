@@ -0,0 +1,114 @@
+"""Unit tests for the Wikidata lookup cache."""
+import asyncio
+
+from python_aws_starter.utils import wiki_cache
+
+
+def test_cached_async_normalizes_query_and_coalesces_calls():
+    wiki_cache.flush()
+    calls = []
+
+    @wiki_cache.cached_async(wiki_cache.search_key)
+    async def search(query, limit=10):
+        calls.append(query)
+        await asyncio.sleep(0.01)
+        return [query.strip().lower()]
+
+    async def burst():
+        return await asyncio.gather(search("Paris", limit=5), search(" paris ", limit=5), search("PARIS", limit=5))
+
+    results = asyncio.run(burst())
+    assert results == [["paris"]] * 3
+    assert len(calls) == 1
+    # Different limit is a different key
+    asyncio.run(search("Paris", limit=6))
+    assert len(calls) == 2
+
+
+def test_cached_skips_empty_results_and_flush_clears():
+    wiki_cache.flush()
+    calls = []
+
+    @wiki_cache.cached(wiki_cache.entity_key)
+    def fetch(qid):
+        calls.append(qid)
+        return {"id": qid} if qid != "Q0" else None
+
+    assert fetch("Q517") == {"id": "Q517"}
+    assert fetch("Q517") == {"id": "Q517"}
+    assert fetch("Q0") is None
+    assert fetch("Q0") is None
+    assert calls == ["Q517", "Q0", "Q0"]
+
+    assert wiki_cache.flush() == 1
+    fetch("Q517")
+    assert calls[-1] == "Q517"
+
+
+def test_cached_results_are_copied_per_caller():
+    wiki_cache.flush()
+
+    @wiki_cache.cached(wiki_cache.entity_key)
+    def fetch(qid):
+        return {"id": qid, "claims": {"P31": [{"id": "Q5"}]}}
+
+    @wiki_cache.cached_async(wiki_cache.search_key)
+    async def search(query, limit=10):
+        return [{"id": "Q90"}]
+
+    fetch("Q1")["claims"]["P31"].clear()
+    assert fetch("Q1")["claims"]["P31"] == [{"id": "Q5"}]
+
+    asyncio.run(search("Paris")).append({"id": "Q0"})
+    assert asyncio.run(search("Paris")) == [{"id": "Q90"}]
+    wiki_cache.flush()
+
+
+def test_cached_async_late_waiters_share_the_inflight_fetch():
+    wiki_cache.flush()
+    calls = []
+
+    @wiki_cache.cached_async(wiki_cache.entity_key)
+    async def fetch(qid):
+        calls.append(qid)
+        await asyncio.sleep(0.02)
+        return {"id": qid}
+
+    async def staggered():
+        first = asyncio.ensure_future(fetch("Q1"))
+        await asyncio.sleep(0.005)
+        # The first caller gives up; later callers still join its fetch
+        first.cancel()
+        return await asyncio.gather(fetch("Q1"), fetch("Q1"))
+
+    assert asyncio.run(staggered()) == [{"id": "Q1"}, {"id": "Q1"}]
+    assert calls == ["Q1"]
+    wiki_cache.flush()
+
+
+def test_sync_search_is_cached_per_normalized_query(monkeypatch):
+    from python_aws_starter.utils import wikidata as wd
+
+    wiki_cache.flush()
+    calls = []
+
+    class FakeResponse:
+        status_code = 200
+        text = ""
+
+        def raise_for_status(self):
+            pass
+
+        def json(self):
+            return {"search": [{"id": "Q90", "label": "Paris"}]}
+
+    class FakeSession:
+        def get(self, url, params=None, **kwargs):
+            calls.append(params["search"])
+            return FakeResponse()
+
+    monkeypatch.setattr(wd, "_get_session", lambda: FakeSession())
+    assert wd.search_wikidata_entities("Paris", limit=5) == [{"id": "Q90", "label": "Paris"}]
+    assert wd.search_wikidata_entities(" paris ", limit=5) == [{"id": "Q90", "label": "Paris"}]
+    assert len(calls) == 1
+    wiki_cache.flush()